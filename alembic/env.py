@@ -21,11 +21,23 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 
+def include_object(object, name, type_, reflected, compare_to):
+    """
+    Skip the pg_trgm global search indexes (idx_<table>_search_trgm): they are GIN expression
+    indexes created by migration 9b4f1c6e2a80 and not declared on the models, so autogenerate
+    would otherwise propose dropping them
+    """
+    if type_ == "index" and name and name.endswith("_search_trgm"):
+        return False
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in offline mode."""
     context.configure(
         url=str(engine.url),
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -42,6 +54,7 @@ def run_migrations_online() -> None:
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
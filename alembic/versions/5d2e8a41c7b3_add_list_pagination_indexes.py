@@ -0,0 +1,52 @@
+"""add_list_pagination_indexes
+
+Revision ID: 5d2e8a41c7b3
+Revises: 7eec19968c33
+Create Date: 2026-10-15 10:12:37.418204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2e8a41c7b3'
+down_revision: Union[str, Sequence[str], None] = '7eec19968c33'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns): partial indexes on non-deleted rows, matching the list queries
+INDEXES = [
+    ("idx_businesses_created_at_id_not_deleted", "businesses", "created_at, id"),
+    ("idx_order_secrets_created_at_id_not_deleted", "order_secrets", "created_at, id"),
+    ("idx_master_types_group_code_code_not_deleted", "master_types", "group_code, code"),
+    ("idx_products_created_at_id_not_deleted", "products", "created_at, id"),
+]
+
+
+def upgrade() -> None:
+    """Add indexes for list sorting and keyset pagination (created_at DESC, id DESC)."""
+
+    # products is created by Base.metadata.create_all, not by a migration
+    existing_tables = set(sa.inspect(op.get_bind()).get_table_names())
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction; it doesn't lock writes
+    with op.get_context().autocommit_block():
+        for index_name, table, columns in INDEXES:
+            if table not in existing_tables:
+                continue
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+                f"ON {table} ({columns}) WHERE deleted_at IS NULL"
+            )
+
+
+def downgrade() -> None:
+    """Drop list sorting / keyset pagination indexes."""
+
+    with op.get_context().autocommit_block():
+        for index_name, _, _ in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
@@ -0,0 +1,52 @@
+"""add_search_trigram_indexes
+
+Revision ID: 9b4f1c6e2a80
+Revises: 5d2e8a41c7b3
+Create Date: 2026-10-15 11:03:52.207614
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b4f1c6e2a80'
+down_revision: Union[str, Sequence[str], None] = '5d2e8a41c7b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, __search_columns__ of the model); the index expression must match build_search_document
+SEARCH_COLUMNS = [
+    ("businesses", ("business_code", "business_name", "shop_name", "email")),
+    ("master_types", ("code", "name", "description")),
+    ("order_secrets", ("order_secret_id", "message", "emotional", "from_name")),
+]
+
+
+def _search_document(columns) -> str:
+    return " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+
+
+def upgrade() -> None:
+    """Add pg_trgm GIN indexes so global search (document ILIKE '%q%') can use an index."""
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction; it doesn't lock writes
+    with op.get_context().autocommit_block():
+        for table, columns in SEARCH_COLUMNS:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_{table}_search_trgm "
+                f"ON {table} USING gin (({_search_document(columns)}) gin_trgm_ops) "
+                f"WHERE deleted_at IS NULL"
+            )
+
+
+def downgrade() -> None:
+    """Drop global search trigram indexes (pg_trgm extension is kept)."""
+
+    with op.get_context().autocommit_block():
+        for table, _ in SEARCH_COLUMNS:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS idx_{table}_search_trgm")
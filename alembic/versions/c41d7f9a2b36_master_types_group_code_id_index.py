@@ -0,0 +1,40 @@
+"""master_types_group_code_id_index
+
+Revision ID: c41d7f9a2b36
+Revises: 9b4f1c6e2a80
+Create Date: 2026-10-16 09:24:11.503817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d7f9a2b36'
+down_revision: Union[str, Sequence[str], None] = '9b4f1c6e2a80'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index master types on (group_code, id): the list order with its id tie-breaker."""
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction; it doesn't lock writes
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_master_types_group_code_id_not_deleted "
+            "ON master_types (group_code, id) WHERE deleted_at IS NULL"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_master_types_group_code_code_not_deleted")
+
+
+def downgrade() -> None:
+    """Restore the (group_code, code) index."""
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_master_types_group_code_code_not_deleted "
+            "ON master_types (group_code, code) WHERE deleted_at IS NULL"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_master_types_group_code_id_not_deleted")
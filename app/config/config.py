@@ -10,6 +10,21 @@ DB_NAME = os.getenv("DB_NAME")
 DB_USER = os.getenv("DB_USER")
 DB_PASSWORD = os.getenv("DB_PASSWORD")
 
+# Max rows per multi-row INSERT statement when bulk inserting (variants, mappings, images)
+DB_INSERT_PAGE_SIZE = int(os.getenv("DB_INSERT_PAGE_SIZE", "1000"))
+
+# Connection pool, per uvicorn worker process. Limit: workers * (pool_size + max_overflow) <= Postgres
+# max_connections (default 100, minus admin/migration connections). Defaults: 4 workers * (5 + 5) = 40.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "5"))
+
+# Worker threads for sync (def) route handlers and dependencies, per worker process (Starlette default: 40).
+# Each request holds one connection: keep it at pool_size + max_overflow so threads don't queue on the pool
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "10"))
+
+# Dev/test only: list queries raise on any relationship that was not explicitly eager-loaded
+SQLALCHEMY_RAISELOAD = os.getenv("SQLALCHEMY_RAISELOAD", "0") == "1"
+
 # Validate environment variables
 missing_vars = []
 if not DB_HOST:
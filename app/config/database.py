@@ -1,12 +1,22 @@
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.exc import OperationalError
-from app.config.config import DATABASE_URL, DB_HOST, DB_PORT, DB_NAME, DB_USER
+from app.config.config import (
+    DATABASE_URL, DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_INSERT_PAGE_SIZE, DB_POOL_SIZE, DB_MAX_OVERFLOW
+)
 
 try:
     engine = create_engine(
         DATABASE_URL,
-        pool_pre_ping=True
+        pool_pre_ping=True,
+        # Default 5 + 10 would make most of the 40 handler threads wait for a connection
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        # Bulk inserts are split into pages of this many rows per statement
+        insertmanyvalues_page_size=DB_INSERT_PAGE_SIZE,
+        # psycopg2: also batch executemany UPDATE/DELETE (execute_batch) instead of one round trip per row
+        executemany_mode="values_plus_batch",
+        executemany_batch_page_size=500
     )
 
     # Test connection
@@ -1,13 +1,16 @@
-from fastapi import Depends
+from fastapi import Depends, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
 from uuid import UUID
+from functools import lru_cache
+import orjson
 
 from app.config.database import SessionLocal
 from app.config_env import SECRET_KEY, ALGORITHM
-from app.core.exceptions import UnauthorizedException
+from app.core.exceptions import UnauthorizedException, ForbiddenException, BadRequestException
 
 # Security scheme for Swagger UI
 security = HTTPBearer(
@@ -24,6 +27,30 @@ class CurrentUser(BaseModel):
     role: str
 
 
+@lru_cache(maxsize=512)
+def _load_filters(raw: str) -> List[Dict[str, Any]]:
+    """Parse a filters JSON string once; identical strings hit the cache (read-only result)"""
+    try:
+        parsed = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        raise BadRequestException("Invalid filters: must be a JSON array")
+    if not isinstance(parsed, list) or not all(isinstance(item, dict) for item in parsed):
+        raise BadRequestException("Invalid filters: must be a JSON array of objects")
+    return parsed
+
+
+def parse_filters(
+    filters: Optional[str] = Query(
+        None,
+        description='JSON array, e.g. [{"key": "emotional", "operator": "equal", "value": "Senang"}]'
+    )
+) -> Optional[List[Dict[str, Any]]]:
+    """Dependency: parse the `filters` query string into a list of filter dicts"""
+    if not filters:
+        return None
+    return _load_filters(filters)
+
+
 def get_db():
     db = SessionLocal()
     try:
@@ -75,7 +102,9 @@ def get_current_user(
     # Get user from database (lazy import to avoid circular import)
     from app.modules.auth.model import User
 
-    user = db.query(User).filter(User.id == user_id).first()
+    # Looked up on every request (never cached): a deleted user or changed role applies immediately.
+    # Only the four CurrentUser columns are selected, by primary key
+    user = db.query(User.id, User.email, User.username, User.role).filter(User.id == user_id).first()
 
     if user is None:
         raise UnauthorizedException(
@@ -90,3 +119,19 @@ def get_current_user(
         username=user.username,
         role=user.role.value
     )
+
+
+def require_admin(current_user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
+    """
+    Dependency for admin-only endpoints: rejects non-admins before the handler runs
+
+    Raises:
+        ForbiddenException: If the current user is not an admin
+    """
+    if current_user.role != "admin":
+        raise ForbiddenException(
+            message="Only admin can perform this action",
+            details={"required_role": "admin", "current_role": current_user.role}
+        )
+
+    return current_user
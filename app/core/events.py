@@ -1,5 +1,7 @@
 import logging
+import anyio.to_thread
 from sqlalchemy import text
+from app.config.config import THREADPOOL_SIZE
 from app.config.database import engine
 
 logger = logging.getLogger(__name__)
@@ -8,9 +10,12 @@ logger = logging.getLogger(__name__)
 def startup_event():
     """
     Event that runs when application starts
+    - Size the thread pool used by sync route handlers
     - Test database connection
     - Log PostgreSQL information
     """
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
     try:
         with engine.connect() as conn:
             result = conn.execute(text("SELECT version()"))
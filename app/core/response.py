@@ -3,7 +3,8 @@ Standard Response Format for all endpoints
 Ensures consistent response structure across the application
 """
 
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
+import orjson
 from pydantic import BaseModel
 from sqlalchemy.inspection import inspect as sqlalchemy_inspect
 from datetime import datetime
@@ -20,8 +21,15 @@ class SuccessResponse:
         result = {}
         mapper = sqlalchemy_inspect(obj)
 
+        # Columns deferred by the query (e.g. load_only) were never loaded; reading them would
+        # fire one SELECT per object. Expired columns (after commit) are still reloaded.
+        deferred_keys = mapper.unloaded - mapper.expired_attributes
+
         # Serialize columns
         for column in mapper.mapper.column_attrs:
+            if column.key in deferred_keys:
+                continue
+
             value = getattr(obj, column.key)
 
             # Skip password field for security
@@ -125,3 +133,10 @@ class SuccessResponse:
     def retrieved(message: str, data: Any, meta: Optional[dict] = None) -> dict:
         """Response for retrieving data"""
         return SuccessResponse.success(message=message, data=data, meta=meta)
+
+    @staticmethod
+    def ndjson_lines(rows: Iterable[Any]) -> Iterator[bytes]:
+        """Serialize rows one by one as NDJSON lines (for StreamingResponse exports)"""
+        for row in rows:
+            # default=str covers Decimal columns, which orjson doesn't serialize natively
+            yield orjson.dumps(SuccessResponse._serialize_data(row), default=str) + b"\n"
@@ -1,5 +1,6 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
@@ -46,6 +47,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson serializes large list responses faster than stdlib json
     swagger_ui_parameters={
         "persistAuthorization": True  # Swagger UI akan menyimpan token setelah authorize
     }
@@ -54,7 +54,9 @@ class RegisterSchema(BaseModel):
     @classmethod
     def validate_password(cls, v: str):
         v = v.strip()
-        if len(v.encode("utf-8")) > 72:
+        # bcrypt limit is 72 bytes; ASCII strings (isascii() is O(1)) have 1 byte per char, no encode needed
+        byte_length = len(v) if v.isascii() else len(v.encode("utf-8"))
+        if byte_length > 72:
             raise ValueError("Password maksimal 72 karakter")
         if len(v) < 6:
             raise ValueError("Password minimal 6 karakter")
@@ -90,7 +92,7 @@ class UserResponse(BaseModel):
 
     id: UUID
     name: str
-    email: EmailStr
+    email: str
     username: str
     role: RoleEnum
     created_at: datetime | None = None
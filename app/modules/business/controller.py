@@ -1,3 +1,4 @@
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import Optional, List, Dict, Any
 from app.modules.business.usecase import BusinessUsecase
@@ -16,6 +17,20 @@ class BusinessController:
         usecase = BusinessUsecase(db)
         return usecase.get_my_businesses(user_id)
 
+    @staticmethod
+    def stream_businesses(
+        db: Session,
+        search: Optional[str] = None,
+        filters: Optional[List[Dict[str, Any]]] = None,
+        sort_by: Optional[str] = None,
+        sort_order: str = "desc"
+    ):
+        usecase = BusinessUsecase(db)
+        return StreamingResponse(
+            usecase.stream_businesses(search, filters, sort_by, sort_order),
+            media_type="application/x-ndjson"
+        )
+
     @staticmethod
     def get_businesses(
         db: Session,
@@ -24,10 +39,12 @@ class BusinessController:
         sort_by: Optional[str] = None,
         sort_order: str = "desc",
         page: Optional[int] = None,
-        per_page: Optional[int] = None
+        per_page: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True
     ):
         usecase = BusinessUsecase(db)
-        return usecase.get_businesses(search, filters, sort_by, sort_order, page, per_page)
+        return usecase.get_businesses(search, filters, sort_by, sort_order, page, per_page, cursor, include_total)
 
     @staticmethod
     def get_business_by_id(business_id: str, user_id: str, db: Session):
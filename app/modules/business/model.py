@@ -45,6 +45,9 @@ class Business(Base):
     business_type = relationship("MasterTypes")
     products: Mapped[List["Product"]] = relationship("Product", back_populates="business")
 
+    # Global search columns (query_builder.build_search_document, trigram index idx_businesses_search_trgm)
+    __search_columns__ = ('business_code', 'business_name', 'shop_name', 'email')
+
     # Partial unique index: business_code must be unique only for non-deleted records
     __table_args__ = (
         Index(
@@ -53,4 +56,10 @@ class Business(Base):
             unique=True,
             postgresql_where=deleted_at.is_(None)
         ),
+        # List order / keyset pagination: ORDER BY created_at DESC, id DESC (index scanned backward)
+        Index(
+            'idx_businesses_created_at_id_not_deleted',
+            'created_at', 'id',
+            postgresql_where=deleted_at.is_(None)
+        ),
     )
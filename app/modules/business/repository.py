@@ -1,5 +1,6 @@
-from sqlalchemy.orm import Session
-from typing import Optional, List
+from sqlalchemy.orm import Session, joinedload
+from typing import Optional, List, Union
+from uuid import UUID
 from app.modules.business.model import Business
 from app.modules.auth.model import User
 
@@ -14,7 +15,7 @@ class BusinessRepository:
         return business
 
     @staticmethod
-    def find_by_id(db: Session, business_id: str) -> Optional[Business]:
+    def find_by_id(db: Session, business_id: Union[str, UUID]) -> Optional[Business]:
         return db.query(Business).filter(
             Business.id == business_id,
             Business.deleted_at.is_(None)
@@ -28,8 +29,15 @@ class BusinessRepository:
         ).all()
 
     @staticmethod
-    def find_by_id_and_user_id(db: Session, business_id: str, user_id: str) -> Optional[Business]:
-        return db.query(Business).filter(
+    def find_by_id_and_user_id(
+        db: Session, business_id: str, user_id: str, load_user: bool = False
+    ) -> Optional[Business]:
+        query = db.query(Business)
+        if load_user:
+            # Owner comes back in the same SELECT (many-to-one JOIN)
+            query = query.options(joinedload(Business.user))
+
+        return query.filter(
             Business.id == business_id,
             Business.user_id == user_id,
             Business.deleted_at.is_(None)
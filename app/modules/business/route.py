@@ -1,3 +1,4 @@
+from typing import Literal
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from app.config.deps import get_db, get_current_user, CurrentUser
@@ -34,10 +35,9 @@ def get_business_list(
         description="Field untuk sorting (e.g., created_at, business_name)",
         example="created_at"
     ),
-    sort_order: str = Query(
+    sort_order: Literal["asc", "desc"] = Query(
         "desc",
-        description="Sort order: asc atau desc",
-        enum=["asc", "desc"]
+        description="Sort order: asc atau desc"
     ),
     page: int = Query(
         None,
@@ -50,16 +50,38 @@ def get_business_list(
         ge=1,
         le=100
     ),
+    cursor: str = Query(
+        None,
+        description="meta.next_cursor dari halaman sebelumnya (keyset pagination; sort_by kolom NOT NULL, asc/desc)"
+    ),
+    include_total: bool = Query(
+        True,
+        description="Hitung meta.total dan total_pages (COUNT). false = lebih cepat, hanya has_next"
+    ),
+    stream: bool = Query(
+        False,
+        description="Export semua data sebagai NDJSON stream (tanpa pagination, untuk export)"
+    ),
     db: Session = Depends(get_db),
     current_user: CurrentUser = Depends(get_current_user)
 ):
+    if stream:
+        return BusinessController.stream_businesses(
+            db=db,
+            search=search,
+            sort_by=sort_by,
+            sort_order=sort_order
+        )
+
     return BusinessController.get_businesses(
         db=db,
         search=search,
         sort_by=sort_by,
         sort_order=sort_order,
         page=page,
-        per_page=per_page
+        per_page=per_page,
+        cursor=cursor,
+        include_total=include_total
     )
 
 
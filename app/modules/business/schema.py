@@ -170,7 +170,7 @@ class BusinessResponse(BaseModel):
     shop_name: str
     name_owner: str
     phone: str
-    email: EmailStr
+    email: str
     address: str | None = None
     user_id: UUID
     business_type_id: UUID
@@ -1,12 +1,15 @@
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional
+from app.config.database import SessionLocal
 from app.modules.business.repository import BusinessRepository
+from app.modules.business.model import Business
 from app.modules.business.schema import BusinessRegisterSchema, BusinessUpdateSchema
 from app.modules.auth.repository import AuthRepository
 from app.modules.auth.model import User, UserRole
 from app.modules.master_type.model import MasterTypes
 from app.modules.naming_series import get_next_code
 from app.utils.db_validators import auto_validate
+from app.utils.query_builder import build_dynamic_query, paginate_query
 from app.utils.security import hash_password
 from app.core.response import SuccessResponse
 from app.core.exceptions import NotFoundException
@@ -107,22 +110,17 @@ class BusinessUsecase:
             data=businesses
         )
 
-    def get_businesses(
-        self,
-        search: Optional[str] = None,
-        filters: Optional[List[Dict[str, Any]]] = None,
-        sort_by: Optional[str] = None,
-        sort_order: str = "desc",
-        page: Optional[int] = None,
-        per_page: Optional[int] = None
+    @staticmethod
+    def _build_businesses_query(
+        db: Session,
+        search: Optional[str],
+        filters: Optional[List[Dict[str, Any]]],
+        sort_by: Optional[str],
+        sort_order: str
     ):
-        from app.utils.query_builder import build_dynamic_query, calculate_pagination_meta
-        from app.modules.auth.model import User
-        from app.modules.business.model import Business
-
         # Build query with dynamic query builder and JOIN
-        query = build_dynamic_query(
-            db=self.db,
+        return build_dynamic_query(
+            db=db,
             model=Business,
             search=search,
             filters=filters,
@@ -143,39 +141,45 @@ class BusinessUsecase:
                     "relationship": "business_type",
                     "is_outer": True
                 }
-            ],
-            page=page,
-            per_page=per_page
+            ]
         )
 
-        # Get total count for pagination
-        if page is not None and per_page is not None:
-            count_query = build_dynamic_query(
-                db=self.db,
-                model=Business,
-                search=search,
-                filters=filters,
-                auto_search_all_fields=True,
-                joins=[
-                    {
-                        "model": User,
-                        "condition": Business.user_id == User.id,
-                        "relationship": "user"
-                    },
-                    {
-                        "model": MasterTypes,
-                        "condition": Business.business_type_id == MasterTypes.id,
-                        "relationship": "business_type",
-                        "is_outer": True
-                    }
-                ]
-            )
-            total = count_query.count()
-            pagination_meta = calculate_pagination_meta(total, page, per_page)
-        else:
-            pagination_meta = None
+    def stream_businesses(
+        self,
+        search: Optional[str] = None,
+        filters: Optional[List[Dict[str, Any]]] = None,
+        sort_by: Optional[str] = None,
+        sort_order: str = "desc"
+    ) -> Iterator[bytes]:
+        """
+        Export all matching businesses as NDJSON, fetched in batches of 1000 rows (server-side cursor).
+        Uses its own session: the generator runs while the response is being sent.
+        """
+        db = SessionLocal()
+        try:
+            query = self._build_businesses_query(db, search, filters, sort_by, sort_order)
+            yield from SuccessResponse.ndjson_lines(query.yield_per(1000))
+        finally:
+            db.close()
 
-        businesses = query.all()
+    def get_businesses(
+        self,
+        search: Optional[str] = None,
+        filters: Optional[List[Dict[str, Any]]] = None,
+        sort_by: Optional[str] = None,
+        sort_order: str = "desc",
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True
+    ):
+        query = self._build_businesses_query(self.db, search, filters, sort_by, sort_order)
+
+        # One query serves both the COUNT and the page (or a keyset page with a cursor)
+        businesses, pagination_meta = paginate_query(
+            query, Business, sort_by, sort_order, "created_at",
+            page=page, per_page=per_page, cursor=cursor, include_total=include_total
+        )
 
         return SuccessResponse.retrieved(
             message="Businesses retrieved successfully",
@@ -199,9 +203,9 @@ class BusinessUsecase:
 
     def update_business(self, business_id: str, data: BusinessUpdateSchema, current_user):
         try:
-            # Get business with user relationship
+            # Get business with user relationship (one SELECT)
             business = self.repository.find_by_id_and_user_id(
-                self.db, business_id, str(current_user.user_id)
+                self.db, business_id, str(current_user.user_id), load_user=True
             )
 
             if not business:
@@ -213,8 +217,8 @@ class BusinessUsecase:
                     }
                 )
 
-            # Get user
-            user = self.auth_repository.find_by_id(self.db, business.user_id)
+            # Get user (already loaded with the business)
+            user = business.user
             if not user:
                 raise NotFoundException(
                     message="User not found",
@@ -235,8 +239,6 @@ class BusinessUsecase:
                     )
 
             # Validate unique fields
-            from app.modules.business.model import Business
-
             validation_data = {}
             if data.email and data.email != business.email:
                 validation_data["email"] = data.email
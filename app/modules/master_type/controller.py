@@ -1,3 +1,4 @@
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import Optional, List, Dict, Any
 from app.modules.master_type.usecase import MasterTypeUsecase
@@ -11,6 +12,20 @@ class MasterTypeController:
         usecase = MasterTypeUsecase(db)
         return usecase.create_master_type(data, current_user)
 
+    @staticmethod
+    def stream_master_types(
+        db: Session,
+        search: Optional[str] = None,
+        filters: Optional[List[Dict[str, Any]]] = None,
+        sort_by: Optional[str] = None,
+        sort_order: str = "asc"
+    ):
+        usecase = MasterTypeUsecase(db)
+        return StreamingResponse(
+            usecase.stream_master_types(search, filters, sort_by, sort_order),
+            media_type="application/x-ndjson"
+        )
+
     @staticmethod
     def get_master_types(
         db: Session,
@@ -19,10 +34,12 @@ class MasterTypeController:
         sort_by: Optional[str] = None,
         sort_order: str = "asc",
         page: Optional[int] = None,
-        per_page: Optional[int] = None
+        per_page: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True
     ):
         usecase = MasterTypeUsecase(db)
-        return usecase.get_master_types(search, filters, sort_by, sort_order, page, per_page)
+        return usecase.get_master_types(search, filters, sort_by, sort_order, page, per_page, cursor, include_total)
 
     @staticmethod
     def get_master_type_by_id(master_type_id: str, db: Session):
@@ -24,6 +24,9 @@ class MasterTypes(Base):
     deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     deleted_by: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
+    # Global search columns (query_builder.build_search_document, trigram index idx_master_types_search_trgm)
+    __search_columns__ = ('code', 'name', 'description')
+
     __table_args__ = (
         Index(
             'idx_master_types_code_unique_not_deleted',
@@ -31,4 +34,10 @@ class MasterTypes(Base):
             unique=True,
             postgresql_where=deleted_at.is_(None)
         ),
+        # Default list order / keyset pagination: ORDER BY group_code, id (id is the sort tie-breaker)
+        Index(
+            'idx_master_types_group_code_id_not_deleted',
+            'group_code', 'id',
+            postgresql_where=deleted_at.is_(None)
+        ),
     )
@@ -1,6 +1,7 @@
+from typing import Literal
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from app.config.deps import get_db, get_current_user, CurrentUser
+from app.config.deps import get_db, require_admin, CurrentUser
 from app.modules.master_type.schema import (
     MasterTypesCreateSchema,
     MasterTypesUpdateSchema
@@ -14,7 +15,7 @@ router = APIRouter()
 def create(
     data: MasterTypesCreateSchema,
     db: Session = Depends(get_db),
-    current_user: CurrentUser = Depends(get_current_user)
+    current_user: CurrentUser = Depends(require_admin)
 ):
     return MasterTypeController.create_master_type(data, db, current_user)
 
@@ -30,10 +31,9 @@ def list_all(
         description="Field untuk sorting (e.g., group_code, code, name)",
         example="group_code"
     ),
-    sort_order: str = Query(
+    sort_order: Literal["asc", "desc"] = Query(
         "asc",
-        description="Sort order: asc atau desc",
-        enum=["asc", "desc"]
+        description="Sort order: asc atau desc"
     ),
     page: int = Query(
         None,
@@ -46,15 +46,37 @@ def list_all(
         ge=1,
         le=100
     ),
+    cursor: str = Query(
+        None,
+        description="meta.next_cursor dari halaman sebelumnya (keyset pagination; sort_by kolom NOT NULL, asc/desc)"
+    ),
+    include_total: bool = Query(
+        True,
+        description="Hitung meta.total dan total_pages (COUNT). false = lebih cepat, hanya has_next"
+    ),
+    stream: bool = Query(
+        False,
+        description="Export semua data sebagai NDJSON stream (tanpa pagination, untuk export)"
+    ),
     db: Session = Depends(get_db)
 ):
+    if stream:
+        return MasterTypeController.stream_master_types(
+            db=db,
+            search=search,
+            sort_by=sort_by,
+            sort_order=sort_order
+        )
+
     return MasterTypeController.get_master_types(
         db=db,
         search=search,
         sort_by=sort_by,
         sort_order=sort_order,
         page=page,
-        per_page=per_page
+        per_page=per_page,
+        cursor=cursor,
+        include_total=include_total
     )
 
 
@@ -71,7 +93,7 @@ def update(
     master_type_id: str,
     data: MasterTypesUpdateSchema,
     db: Session = Depends(get_db),
-    current_user: CurrentUser = Depends(get_current_user)
+    current_user: CurrentUser = Depends(require_admin)
 ):
     return MasterTypeController.update_master_type(master_type_id, data, db, current_user)
 
@@ -80,6 +102,6 @@ def update(
 def delete(
     master_type_id: str,
     db: Session = Depends(get_db),
-    current_user: CurrentUser = Depends(get_current_user)
+    current_user: CurrentUser = Depends(require_admin)
 ):
     return MasterTypeController.delete_master_type(master_type_id, db, current_user)
@@ -1,11 +1,18 @@
-from sqlalchemy.orm import Session
-from typing import List, Dict, Any, Optional
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, load_only
+from typing import Iterator, List, Dict, Any, Optional
+from app.config.database import SessionLocal
 from app.modules.master_type.repository import MasterTypeRepository
-from app.modules.master_type.schema import MasterTypesCreateSchema, MasterTypesUpdateSchema
+from app.modules.master_type.schema import MasterTypesCreateSchema, MasterTypesUpdateSchema, MasterTypesResponse
 from app.modules.master_type.model import MasterTypes
-from app.utils.db_validators import auto_validate
+from app.utils.db_validators import validate_field_length
+from app.utils.query_builder import build_dynamic_query, paginate_query
 from app.core.response import SuccessResponse
-from app.core.exceptions import NotFoundException, ForbiddenException
+from app.core.exceptions import NotFoundException, ConflictException
+
+
+# List queries only SELECT the columns of MasterTypesResponse (deleted_at/deleted_by are always NULL there)
+_LIST_COLUMNS = [getattr(MasterTypes, name) for name in MasterTypesResponse.model_fields]
 
 
 class MasterTypeUsecase:
@@ -14,21 +21,26 @@ class MasterTypeUsecase:
         self.db = db
         self.repository = MasterTypeRepository()
 
-    def create_master_type(self, data: MasterTypesCreateSchema, current_user):
+    def _commit_unique_code(self, code: Optional[str]) -> None:
+        """
+        Commit, mapping a duplicate code to 409. The partial unique index on code (non-deleted rows)
+        is the uniqueness check: no SELECT before the INSERT/UPDATE.
+        """
         try:
-            if current_user.role != "admin":
-                raise ForbiddenException(
-                    message="Only admin can create master types",
-                    details={"required_role": "admin", "current_role": current_user.role}
-                )
-
-            auto_validate(
-                model=MasterTypes,
-                data={"code": data.code},
-                db=self.db,
-                validate_required=False
+            self.db.commit()
+        except IntegrityError as e:
+            if "idx_master_types_code_unique_not_deleted" not in str(e.orig):
+                raise
+            raise ConflictException(
+                message="Code already exists",
+                details={"field": "code", "value": code, "constraint": "unique"}
             )
 
+    def create_master_type(self, data: MasterTypesCreateSchema, current_user):
+        try:
+            # Length only (no query); a duplicate code is caught by the unique index on commit
+            validate_field_length(MasterTypes, {"code": data.code})
+
             master_type_data = {
                 "group_code": data.group_code,
                 "code": data.code,
@@ -39,7 +51,7 @@ class MasterTypeUsecase:
             }
 
             master_type = self.repository.create_master_type(self.db, master_type_data)
-            self.db.commit()
+            self._commit_unique_code(data.code)
             self.db.refresh(master_type)
 
             return SuccessResponse.created(
@@ -51,6 +63,43 @@ class MasterTypeUsecase:
             self.db.rollback()
             raise e
 
+    @staticmethod
+    def _build_master_types_query(
+        db: Session,
+        search: Optional[str],
+        filters: Optional[List[Dict[str, Any]]],
+        sort_by: Optional[str],
+        sort_order: str
+    ):
+        return build_dynamic_query(
+            db=db,
+            model=MasterTypes,
+            search=search,
+            filters=filters,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            default_sort_field="group_code",
+            auto_search_all_fields=True
+        ).options(load_only(*_LIST_COLUMNS))
+
+    def stream_master_types(
+        self,
+        search: Optional[str] = None,
+        filters: Optional[List[Dict[str, Any]]] = None,
+        sort_by: Optional[str] = None,
+        sort_order: str = "asc"
+    ) -> Iterator[bytes]:
+        """
+        Export all matching master types as NDJSON, fetched in batches of 1000 rows (server-side cursor).
+        Uses its own session: the generator runs while the response is being sent.
+        """
+        db = SessionLocal()
+        try:
+            query = self._build_master_types_query(db, search, filters, sort_by, sort_order)
+            yield from SuccessResponse.ndjson_lines(query.yield_per(1000))
+        finally:
+            db.close()
+
     def get_master_types(
         self,
         search: Optional[str] = None,
@@ -58,38 +107,18 @@ class MasterTypeUsecase:
         sort_by: Optional[str] = None,
         sort_order: str = "asc",
         page: Optional[int] = None,
-        per_page: Optional[int] = None
+        per_page: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True
     ):
-        from app.utils.query_builder import build_dynamic_query, calculate_pagination_meta
+        query = self._build_master_types_query(self.db, search, filters, sort_by, sort_order)
 
-        query = build_dynamic_query(
-            db=self.db,
-            model=MasterTypes,
-            search=search,
-            filters=filters,
-            sort_by=sort_by,
-            sort_order=sort_order,
-            default_sort_field="group_code",
-            auto_search_all_fields=True,
-            page=page,
-            per_page=per_page
+        # One query serves both the COUNT and the page (or a keyset page with a cursor)
+        master_types, pagination_meta = paginate_query(
+            query, MasterTypes, sort_by, sort_order, "group_code",
+            page=page, per_page=per_page, cursor=cursor, include_total=include_total
         )
 
-        if page is not None and per_page is not None:
-            count_query = build_dynamic_query(
-                db=self.db,
-                model=MasterTypes,
-                search=search,
-                filters=filters,
-                auto_search_all_fields=True
-            )
-            total = count_query.count()
-            pagination_meta = calculate_pagination_meta(total, page, per_page)
-        else:
-            pagination_meta = None
-
-        master_types = query.all()
-
         return SuccessResponse.retrieved(
             message="Master types retrieved successfully",
             data=master_types,
@@ -118,12 +147,6 @@ class MasterTypeUsecase:
 
     def update_master_type(self, master_type_id: str, data: MasterTypesUpdateSchema, current_user):
         try:
-            if current_user.role != "admin":
-                raise ForbiddenException(
-                    message="Only admin can update master types",
-                    details={"required_role": "admin", "current_role": current_user.role}
-                )
-
             master_type = self.repository.find_by_id(self.db, master_type_id)
 
             if not master_type:
@@ -133,18 +156,13 @@ class MasterTypeUsecase:
                 )
 
             if data.code and data.code != master_type.code:
-                auto_validate(
-                    model=MasterTypes,
-                    data={"code": data.code},
-                    db=self.db,
-                    validate_required=False
-                )
+                validate_field_length(MasterTypes, {"code": data.code})
 
             update_data = data.model_dump(exclude_unset=True)
             update_data["updated_by"] = current_user.email
 
             self.repository.update_master_type(self.db, master_type, update_data)
-            self.db.commit()
+            self._commit_unique_code(data.code)
             self.db.refresh(master_type)
 
             return SuccessResponse.success(
@@ -158,12 +176,6 @@ class MasterTypeUsecase:
 
     def delete_master_type(self, master_type_id: str, current_user):
         try:
-            if current_user.role != "admin":
-                raise ForbiddenException(
-                    message="Only admin can delete master types",
-                    details={"required_role": "admin", "current_role": current_user.role}
-                )
-
             master_type = self.repository.find_by_id(self.db, master_type_id)
 
             if not master_type:
@@ -1,5 +1,6 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional
 from uuid import UUID
 from app.modules.media.model import ProductImage
 
@@ -23,34 +24,37 @@ class ProductImageRepository:
         db.flush()  # Flush to get the ID without committing
         return image
 
-    def create_images_bulk(self, db: Session, images_data: List[Dict[str, Any]]) -> List[ProductImage]:
+    def create_images_bulk(self, db: Session, images_data: Iterable[Dict[str, Any]], flush: bool = True) -> List[ProductImage]:
         """
         Create multiple product images in bulk
 
         Args:
             db: Database session
-            images_data: List of dicts containing image data
+            images_data: Iterable of dicts containing image data (a generator is fine)
+            flush: Flush immediately (set False when the caller flushes once at the end)
 
         Returns:
             List of created ProductImage objects
         """
         images = [ProductImage(**data) for data in images_data]
         db.add_all(images)
-        db.flush()
+        if flush:
+            db.flush()
         return images
 
-    def bulk_create_images(self, db: Session, images_data: List[Dict[str, Any]]) -> List[ProductImage]:
+    def bulk_create_images(self, db: Session, images_data: Iterable[Dict[str, Any]], flush: bool = True) -> List[ProductImage]:
         """
         Alias for create_images_bulk for consistency with other repositories
 
         Args:
             db: Database session
-            images_data: List of dicts containing image data
+            images_data: Iterable of dicts containing image data (a generator is fine)
+            flush: Flush immediately (set False when the caller flushes once at the end)
 
         Returns:
             List of created ProductImage objects
         """
-        return self.create_images_bulk(db, images_data)
+        return self.create_images_bulk(db, images_data, flush)
 
     def find_by_id(self, db: Session, image_id: UUID) -> Optional[ProductImage]:
         """Find image by ID"""
@@ -64,6 +68,15 @@ class ProductImageRepository:
             ProductImage.deleted_at.is_(None)
         ).order_by(ProductImage.display_order).all()
 
+    def find_image_paths_by_product(self, db: Session, product_id: UUID) -> List[str]:
+        """Get image_path of every image of a product (main + variant images), without loading ORM objects"""
+        return db.scalars(
+            select(ProductImage.image_path).where(
+                ProductImage.product_id == product_id,
+                ProductImage.deleted_at.is_(None)
+            )
+        ).all()
+
     def find_by_variant_id(self, db: Session, variant_id: UUID) -> List[ProductImage]:
         """Get all images for a specific variant"""
         return db.query(ProductImage).filter(
@@ -117,11 +130,12 @@ class ProductImageRepository:
         """Soft delete all images for a product"""
         from datetime import datetime
         db.query(ProductImage).filter(
-            ProductImage.product_id == product_id
+            ProductImage.product_id == product_id,
+            ProductImage.deleted_at.is_(None)
         ).update({
             "deleted_at": datetime.utcnow(),
             "deleted_by": deleted_by
-        })
+        }, synchronize_session=False)
         db.flush()
 
     def delete_by_variant(self, db: Session, variant_id: UUID, deleted_by: str) -> None:
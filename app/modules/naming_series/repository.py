@@ -1,27 +1,25 @@
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
-from typing import Optional
 from app.modules.naming_series.model import NamingSeries
 
 
 class NamingSeriesRepository:
 
     @staticmethod
-    def find_by_prefix_with_lock(db: Session, code_prefix: str) -> Optional[NamingSeries]:
-        """Get naming series by prefix with row lock for update"""
-        return db.query(NamingSeries).filter(
-            NamingSeries.code_prefix == code_prefix
-        ).with_for_update().first()
-
-    @staticmethod
-    def create_naming_series(db: Session, data: dict) -> NamingSeries:
-        """Create new naming series"""
-        naming_series = NamingSeries(**data)
-        db.add(naming_series)
-        db.flush()
-        return naming_series
-
-    @staticmethod
-    def increment_last_number(naming_series: NamingSeries) -> int:
-        """Increment and return the next number"""
-        naming_series.last_number += 1
-        return naming_series.last_number
+    def upsert_next_number(db: Session, data: dict) -> Row:
+        """
+        INSERT ... ON CONFLICT (code_prefix) DO UPDATE SET last_number = last_number + 1 RETURNING.
+        Creates the series at 1 or increments it in one statement; returns (last_number, padding_length, code_prefix).
+        """
+        stmt = (
+            pg_insert(NamingSeries)
+            .values(**data, last_number=1)
+            .on_conflict_do_update(
+                index_elements=[NamingSeries.code_prefix],
+                set_={"last_number": NamingSeries.last_number + 1, "updated_at": func.now()}
+            )
+            .returning(NamingSeries.last_number, NamingSeries.padding_length, NamingSeries.code_prefix)
+        )
+        return db.execute(stmt).one()
@@ -32,27 +32,15 @@ def get_next_code(
     """
     repository = NamingSeriesRepository()
 
-    # Ambil naming series berdasarkan prefix dengan lock
-    naming_series = repository.find_by_prefix_with_lock(db, code_prefix)
-
-    # Jika belum ada, create baru
-    if not naming_series:
-        data = {
-            "code_prefix": code_prefix,
-            "last_number": 0,
-            "padding_length": padding_length,
-            "description": description or f"{code_prefix} code series"
-        }
-        naming_series = repository.create_naming_series(db, data)
-
-    # Increment last_number
-    next_number = repository.increment_last_number(naming_series)
-
-    # Format dengan padding
-    padded_number = str(next_number).zfill(naming_series.padding_length)
-
-    # Generate kode lengkap
-    generated_code = f"{naming_series.code_prefix}{padded_number}"
+    # Create (mulai dari 1) atau increment dalam satu statement; aman dari race antar worker
+    next_number, series_padding_length, series_prefix = repository.upsert_next_number(db, {
+        "code_prefix": code_prefix,
+        "padding_length": padding_length,
+        "description": description or f"{code_prefix} code series"
+    })
+
+    # Generate kode lengkap dengan padding (satu format, tanpa zfill + concat)
+    generated_code = f"{series_prefix}{next_number:0{series_padding_length}d}"
 
     # TIDAK melakukan commit, biar caller yang handle
     # Ini penting untuk transaction atomicity
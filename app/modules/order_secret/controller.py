@@ -1,5 +1,6 @@
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, FrozenSet
 from app.modules.order_secret.usecase import OrderSecretUsecase
 from app.modules.order_secret.schema import OrderSecretCreateSchema, OrderSecretUpdateSchema
 from app.config.deps import CurrentUser
@@ -12,6 +13,26 @@ class OrderSecretController:
         usecase = OrderSecretUsecase(db)
         return usecase.create_order_secret(data, current_user)
 
+    @staticmethod
+    def create_order_secrets_batch(data: List[OrderSecretCreateSchema], db: Session, current_user: CurrentUser):
+        usecase = OrderSecretUsecase(db)
+        return usecase.create_order_secrets_batch(data, current_user)
+
+    @staticmethod
+    def stream_order_secrets(
+        db: Session,
+        search: Optional[str] = None,
+        filters: Optional[List[Dict[str, Any]]] = None,
+        sort_by: Optional[str] = None,
+        sort_order: str = "desc",
+        fields: Optional[FrozenSet[str]] = None
+    ):
+        usecase = OrderSecretUsecase(db)
+        return StreamingResponse(
+            usecase.stream_order_secrets(search, filters, sort_by, sort_order, fields),
+            media_type="application/x-ndjson"
+        )
+
     @staticmethod
     def get_order_secrets(
         db: Session,
@@ -20,10 +41,15 @@ class OrderSecretController:
         sort_by: Optional[str] = None,
         sort_order: str = "desc",
         page: Optional[int] = None,
-        per_page: Optional[int] = None
+        per_page: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        fields: Optional[FrozenSet[str]] = None
     ):
         usecase = OrderSecretUsecase(db)
-        return usecase.get_order_secrets(search, filters, sort_by, sort_order, page, per_page)
+        return usecase.get_order_secrets(
+            search, filters, sort_by, sort_order, page, per_page, cursor, include_total, fields
+        )
 
     @staticmethod
     def get_order_secret_by_id(order_secret_id: str, db: Session):
@@ -1,4 +1,4 @@
-from sqlalchemy import String, DateTime, ForeignKey
+from sqlalchemy import String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
@@ -25,3 +25,15 @@ class OrderSecret(Base):
     deleted_by: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
     marketplace_type = relationship("MasterTypes")
+
+    # Global search columns (query_builder.build_search_document, trigram index idx_order_secrets_search_trgm)
+    __search_columns__ = ('order_secret_id', 'message', 'emotional', 'from_name')
+
+    __table_args__ = (
+        # List order / keyset pagination: ORDER BY created_at DESC, id DESC (index scanned backward)
+        Index(
+            'idx_order_secrets_created_at_id_not_deleted',
+            'created_at', 'id',
+            postgresql_where=deleted_at.is_(None)
+        ),
+    )
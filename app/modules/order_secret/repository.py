@@ -1,7 +1,10 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, literal, select
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from typing import Optional, List
 from datetime import datetime
 from app.modules.order_secret.model import OrderSecret
+from app.modules.master_type.model import MasterTypes
 
 
 class OrderSecretRepository:
@@ -14,8 +17,54 @@ class OrderSecretRepository:
         return order_secret
 
     @staticmethod
-    def find_by_order_secret_id(db: Session, order_secret_id: str) -> Optional[OrderSecret]:
-        return db.query(OrderSecret).filter(
+    def create_if_marketplace_type_exists(db: Session, order_secret_data: dict) -> Optional[OrderSecret]:
+        """
+        INSERT ... SELECT ... WHERE EXISTS (active marketplace type) ON CONFLICT DO NOTHING RETURNING *.
+        One round trip; returns None if the marketplace type is missing or order_secret_id is taken.
+        """
+        columns = list(order_secret_data)
+        marketplace_type_exists = exists().where(
+            MasterTypes.id == order_secret_data["marketplace_type_id"],
+            MasterTypes.deleted_at.is_(None)
+        )
+        source = select(
+            *(literal(value, OrderSecret.__table__.c[name].type) for name, value in order_secret_data.items())
+        ).where(marketplace_type_exists)
+
+        stmt = (
+            pg_insert(OrderSecret)
+            .from_select(columns, source)
+            .on_conflict_do_nothing(index_elements=[OrderSecret.order_secret_id])
+            .returning(OrderSecret)
+        )
+        return db.scalars(stmt).first()
+
+    @staticmethod
+    def bulk_create_ignore_existing(db: Session, rows: List[dict]) -> List[OrderSecret]:
+        """INSERT ... ON CONFLICT (order_secret_id) DO NOTHING; returns only the inserted rows"""
+        stmt = (
+            pg_insert(OrderSecret)
+            .on_conflict_do_nothing(index_elements=[OrderSecret.order_secret_id])
+            .returning(OrderSecret)
+        )
+        # executemany through insertmanyvalues: one multi-row statement per DB_INSERT_PAGE_SIZE rows
+        return list(db.scalars(stmt, rows))
+
+    @staticmethod
+    def find_by_order_secret_id(
+        db: Session, order_secret_id: str, load_marketplace_type: bool = False
+    ) -> Optional[OrderSecret]:
+        query = db.query(OrderSecret)
+        if load_marketplace_type:
+            # Same fields as the list endpoint, loaded in the same SELECT (many-to-one JOIN)
+            query = query.options(
+                joinedload(OrderSecret.marketplace_type).load_only(
+                    MasterTypes.id, MasterTypes.name, MasterTypes.code,
+                    MasterTypes.description, MasterTypes.group_code
+                )
+            )
+
+        return query.filter(
             OrderSecret.order_secret_id == order_secret_id,
             OrderSecret.deleted_at.is_(None)
         ).first()
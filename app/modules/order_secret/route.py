@@ -1,39 +1,63 @@
+from typing import Any, Dict, List, Literal, Optional
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from app.config.deps import get_db, get_current_user, CurrentUser
+from app.config.deps import get_db, parse_filters, require_admin, CurrentUser
 from app.modules.order_secret.schema import (
     OrderSecretCreateSchema,
     OrderSecretUpdateSchema
 )
 from app.modules.order_secret.controller import OrderSecretController
+from app.core.exceptions import ValidationException
 
 router = APIRouter()
 
+# Kolom yang boleh dipakai untuk sort_by di list order secret
+SORTABLE_FIELDS = frozenset({
+    "order_secret_id", "marketplace_type_id", "message", "emotional", "from_name",
+    "created_at", "created_by", "updated_at", "updated_by",
+})
+
+# Kolom yang boleh diminta lewat `fields` (id dan created_at selalu ikut untuk cursor)
+SELECTABLE_FIELDS = SORTABLE_FIELDS | {"id"}
+
 
 @router.post("/", summary="Create order secret")
 def create(
     data: OrderSecretCreateSchema,
     db: Session = Depends(get_db),
-    current_user: CurrentUser = Depends(get_current_user)
+    current_user: CurrentUser = Depends(require_admin)
 ):
     return OrderSecretController.create_order_secret(data, db, current_user)
 
 
+@router.post("/batch", summary="Create order secrets in batch")
+def create_batch(
+    data: List[OrderSecretCreateSchema],
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(require_admin)
+):
+    """
+    Buat banyak order secret dalam satu transaksi (maks 1000).
+    order_secret_id yang sudah ada dilewati dan dikembalikan di data.skipped.
+    """
+    return OrderSecretController.create_order_secrets_batch(data, db, current_user)
+
+
 @router.get("/", summary="Get all order secrets")
 def list_all(
     search: str = Query(
         None,
         description="Search by order_secret_id, message, emotional, from_name"
     ),
+    parsed_filters: Optional[List[Dict[str, Any]]] = Depends(parse_filters),
     sort_by: str = Query(
         None,
         description="Field untuk sorting (e.g., created_at, order_secret_id)",
         example="created_at"
     ),
-    sort_order: str = Query(
+    sort_order: Literal["asc", "desc"] = Query(
         "desc",
-        description="Sort order: asc atau desc",
-        enum=["asc", "desc"]
+        description="Sort order: asc atau desc"
     ),
     page: int = Query(
         None,
@@ -46,15 +70,60 @@ def list_all(
         ge=1,
         le=100
     ),
+    cursor: str = Query(
+        None,
+        description="meta.next_cursor dari halaman sebelumnya (keyset pagination; sort_by kolom NOT NULL, asc/desc)"
+    ),
+    include_total: bool = Query(
+        True,
+        description="Hitung meta.total dan total_pages (COUNT). false = lebih cepat, hanya has_next"
+    ),
+    fields: str = Query(
+        None,
+        description="Kolom yang dikembalikan, dipisah koma (e.g., order_secret_id,from_name,emotional)"
+    ),
+    stream: bool = Query(
+        False,
+        description="Export semua data sebagai NDJSON stream (tanpa pagination, untuk export)"
+    ),
     db: Session = Depends(get_db)
 ):
+    if sort_by and sort_by not in SORTABLE_FIELDS:
+        raise ValidationException(
+            f"Invalid sort_by '{sort_by}'",
+            details={"allowed": sorted(SORTABLE_FIELDS)}
+        )
+    selected_fields = None
+    if fields:
+        selected_fields = frozenset(name.strip() for name in fields.split(",") if name.strip())
+        unknown_fields = selected_fields - SELECTABLE_FIELDS
+        if unknown_fields:
+            raise ValidationException(
+                f"Invalid fields: {', '.join(sorted(unknown_fields))}",
+                details={"allowed": sorted(SELECTABLE_FIELDS)}
+            )
+
+    if stream:
+        return OrderSecretController.stream_order_secrets(
+            db=db,
+            search=search,
+            filters=parsed_filters,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            fields=selected_fields
+        )
+
     return OrderSecretController.get_order_secrets(
         db=db,
         search=search,
+        filters=parsed_filters,
         sort_by=sort_by,
         sort_order=sort_order,
         page=page,
-        per_page=per_page
+        per_page=per_page,
+        cursor=cursor,
+        include_total=include_total,
+        fields=selected_fields
     )
 
 
@@ -79,6 +148,6 @@ def update(
 def delete(
     order_secret_id: str,
     db: Session = Depends(get_db),
-    current_user: CurrentUser = Depends(get_current_user)
+    current_user: CurrentUser = Depends(require_admin)
 ):
     return OrderSecretController.delete_order_secret(order_secret_id, db, current_user)
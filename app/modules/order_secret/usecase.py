@@ -1,15 +1,21 @@
-from sqlalchemy.orm import Session
-from typing import List, Dict, Any, Optional
+from sqlalchemy.orm import Session, load_only
+from typing import Iterator, List, Dict, Any, FrozenSet, Optional
+from app.config.database import SessionLocal
 from app.modules.order_secret.repository import OrderSecretRepository
 from app.modules.order_secret.schema import OrderSecretCreateSchema, OrderSecretUpdateSchema
 from app.modules.order_secret.model import OrderSecret
 from app.modules.master_type.model import MasterTypes
-from app.utils.db_validators import auto_validate
+from app.utils.query_builder import build_dynamic_query, paginate_query
+from app.utils.db_validators import validate_field_length
 from app.core.response import SuccessResponse
-from app.core.exceptions import NotFoundException, ForbiddenException
+from app.core.exceptions import NotFoundException, BadRequestException, ConflictException, ValidationException
 from app.config.deps import CurrentUser
 
 
+# Maximum number of order secrets accepted by one batch create request
+MAX_BATCH_SIZE = 1000
+
+
 class OrderSecretUsecase:
 
     def __init__(self, db: Session):
@@ -18,27 +24,7 @@ class OrderSecretUsecase:
 
     def create_order_secret(self, data: OrderSecretCreateSchema, current_user: CurrentUser):
         try:
-            if current_user.role != "admin":
-                raise ForbiddenException(
-                    message="Only admin can create order secrets",
-                    details={"required_role": "admin", "current_role": current_user.role}
-                )
-
-            marketplace_type = self.db.query(MasterTypes).filter(
-                MasterTypes.id == data.marketplace_type_id,
-                MasterTypes.deleted_at.is_(None)
-            ).first()
-            if not marketplace_type:
-                raise NotFoundException(
-                    message="Marketplace type not found",
-                    details={"marketplace_type_id": str(data.marketplace_type_id)}
-                )
-
-            auto_validate(
-                model=OrderSecret,
-                data=data.model_dump(),
-                db=self.db
-            )
+            validate_field_length(OrderSecret, data.model_dump())
 
             order_secret_data = {
                 "order_secret_id": data.order_secret_id,
@@ -46,31 +32,115 @@ class OrderSecretUsecase:
                 "created_by": current_user.email
             }
 
-            order_secret = self.repository.create_order_secret(self.db, order_secret_data)
-            self.db.commit()
-            self.db.refresh(order_secret)
+            # Marketplace type check, unique check and insert in one statement
+            order_secret = self.repository.create_if_marketplace_type_exists(self.db, order_secret_data)
+            if order_secret is None:
+                self._raise_create_rejected(data)
 
-            return SuccessResponse.created(
+            # Serialize before commit: RETURNING already loaded every column
+            response = SuccessResponse.created(
                 message="Order secret created successfully",
                 data=order_secret
             )
+            self.db.commit()
+
+            return response
         except Exception as e:
             self.db.rollback()
             raise e
 
-    def get_order_secrets(
-        self,
-        search: Optional[str] = None,
-        filters: Optional[List[Dict[str, Any]]] = None,
-        sort_by: Optional[str] = None,
-        sort_order: str = "desc",
-        page: Optional[int] = None,
-        per_page: Optional[int] = None
-    ):
-        from app.utils.query_builder import build_dynamic_query, calculate_pagination_meta
+    def _raise_create_rejected(self, data: OrderSecretCreateSchema) -> None:
+        """Explain why the conditional insert returned no row (only runs on the failure path)"""
+        marketplace_type_found = self.db.query(
+            self.db.query(MasterTypes).filter(
+                MasterTypes.id == data.marketplace_type_id,
+                MasterTypes.deleted_at.is_(None)
+            ).exists()
+        ).scalar()
+        if not marketplace_type_found:
+            raise NotFoundException(
+                message="Marketplace type not found",
+                details={"marketplace_type_id": str(data.marketplace_type_id)}
+            )
+        raise ConflictException(
+            message="Order_secret_id already exists",
+            details={
+                "field": "order_secret_id",
+                "value": data.order_secret_id,
+                "constraint": "unique"
+            }
+        )
+
+    def create_order_secrets_batch(self, data: List[OrderSecretCreateSchema], current_user: CurrentUser):
+        """Create many order secrets in one transaction; IDs that already exist are skipped"""
+        try:
+            if not data:
+                raise BadRequestException("Batch must contain at least one order secret")
+            if len(data) > MAX_BATCH_SIZE:
+                raise BadRequestException(
+                    f"Batch size exceeds maximum of {MAX_BATCH_SIZE}",
+                    details={"max_batch_size": MAX_BATCH_SIZE, "received": len(data)}
+                )
 
+            # 1. Same length validation as the single create, per item (over-length would be a DB error)
+            for index, item in enumerate(data):
+                try:
+                    validate_field_length(OrderSecret, item.model_dump())
+                except ValidationException as e:
+                    e.details["index"] = index
+                    raise
+
+            # 2. Validate all referenced marketplace types with one query
+            marketplace_type_ids = {item.marketplace_type_id for item in data}
+            found_ids = {
+                row.id for row in self.db.query(MasterTypes.id).filter(
+                    MasterTypes.id.in_(marketplace_type_ids),
+                    MasterTypes.deleted_at.is_(None)
+                )
+            }
+            missing_ids = marketplace_type_ids - found_ids
+            if missing_ids:
+                raise NotFoundException(
+                    message="Marketplace type not found",
+                    details={"marketplace_type_id": sorted(str(i) for i in missing_ids)}
+                )
+
+            # 3. Bulk insert; duplicates of existing order_secret_id are ignored by the database
+            rows = [
+                {
+                    "order_secret_id": item.order_secret_id,
+                    "marketplace_type_id": item.marketplace_type_id,
+                    "created_by": current_user.email
+                }
+                for item in data
+            ]
+            created = self.repository.bulk_create_ignore_existing(self.db, rows)
+            created_ids = {order_secret.order_secret_id for order_secret in created}
+            skipped = sorted({item.order_secret_id for item in data} - created_ids)
+
+            # 4. Serialize before commit: RETURNING already loaded every column
+            response = SuccessResponse.created(
+                message=f"{len(created)} order secrets created successfully",
+                data={"created": created, "skipped": skipped}
+            )
+            self.db.commit()
+
+            return response
+        except Exception as e:
+            self.db.rollback()
+            raise e
+
+    @staticmethod
+    def _build_order_secrets_query(
+        db: Session,
+        search: Optional[str],
+        filters: Optional[List[Dict[str, Any]]],
+        sort_by: Optional[str],
+        sort_order: str,
+        fields: Optional[FrozenSet[str]] = None
+    ):
         query = build_dynamic_query(
-            db=self.db,
+            db=db,
             model=OrderSecret,
             search=search,
             filters=filters,
@@ -85,32 +155,54 @@ class OrderSecretUsecase:
                     "relationship": "marketplace_type",
                     "load_only": ["id", "name", "code", "description", "group_code"]
                 }
-            ],
-            page=page,
-            per_page=per_page
+            ]
         )
-
-        if page is not None and per_page is not None:
-            count_query = build_dynamic_query(
-                db=self.db,
-                model=OrderSecret,
-                search=search,
-                filters=filters,
-                auto_search_all_fields=True,
-                joins=[
-                    {
-                        "model": MasterTypes,
-                        "condition": OrderSecret.marketplace_type_id == MasterTypes.id,
-                        "relationship": "marketplace_type"
-                    }
-                ]
+        if fields:
+            # Only SELECT the requested columns; id and the sort column are kept for keyset cursors
+            cursor_fields = {"id", "created_at", sort_by or "created_at"}
+            query = query.options(
+                load_only(*(getattr(OrderSecret, name) for name in fields | cursor_fields))
             )
-            total = count_query.count()
-            pagination_meta = calculate_pagination_meta(total, page, per_page)
-        else:
-            pagination_meta = None
+        return query
 
-        order_secrets = query.all()
+    def stream_order_secrets(
+        self,
+        search: Optional[str] = None,
+        filters: Optional[List[Dict[str, Any]]] = None,
+        sort_by: Optional[str] = None,
+        sort_order: str = "desc",
+        fields: Optional[FrozenSet[str]] = None
+    ) -> Iterator[bytes]:
+        """
+        Export all matching order secrets as NDJSON, fetched in batches of 1000 rows (server-side cursor).
+        Uses its own session: the generator runs while the response is being sent.
+        """
+        db = SessionLocal()
+        try:
+            query = self._build_order_secrets_query(db, search, filters, sort_by, sort_order, fields)
+            yield from SuccessResponse.ndjson_lines(query.yield_per(1000))
+        finally:
+            db.close()
+
+    def get_order_secrets(
+        self,
+        search: Optional[str] = None,
+        filters: Optional[List[Dict[str, Any]]] = None,
+        sort_by: Optional[str] = None,
+        sort_order: str = "desc",
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        fields: Optional[FrozenSet[str]] = None
+    ):
+        query = self._build_order_secrets_query(self.db, search, filters, sort_by, sort_order, fields)
+
+        # One query serves both the COUNT and the page (or a keyset page with a cursor)
+        order_secrets, pagination_meta = paginate_query(
+            query, OrderSecret, sort_by, sort_order, "created_at",
+            page=page, per_page=per_page, cursor=cursor, include_total=include_total
+        )
 
         return SuccessResponse.retrieved(
             message="Order secrets retrieved successfully",
@@ -119,7 +211,9 @@ class OrderSecretUsecase:
         )
 
     def get_order_secret_by_id(self, order_secret_id: str):
-        order_secret = self.repository.find_by_order_secret_id(self.db, order_secret_id)
+        order_secret = self.repository.find_by_order_secret_id(
+            self.db, order_secret_id, load_marketplace_type=True
+        )
         if not order_secret:
             raise NotFoundException(
                 message="Order secret not found",
@@ -161,12 +255,6 @@ class OrderSecretUsecase:
 
     def delete_order_secret(self, order_secret_id: str, current_user: CurrentUser):
         try:
-            if current_user.role != "admin":
-                raise ForbiddenException(
-                    message="Only admin can delete order secrets",
-                    details={"required_role": "admin", "current_role": current_user.role}
-                )
-
             order_secret = self.repository.find_by_order_secret_id(self.db, order_secret_id)
             if not order_secret:
                 raise NotFoundException(
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Iterable
 from uuid import UUID
 from app.modules.product_variants.model import (
     ProductVariant,
@@ -19,20 +20,22 @@ class VariantAttributeRepository:
         return attribute
 
     @staticmethod
-    def bulk_create_attributes(db: Session, attributes_data: List[dict]) -> List[VariantAttribute]:
+    def bulk_create_attributes(db: Session, attributes_data: List[dict], flush: bool = True) -> List[VariantAttribute]:
         """
         Create multiple attributes in bulk
 
         Args:
             db: Database session
             attributes_data: List of dicts containing attribute data
+            flush: Flush immediately (set False when ids are assigned by the caller)
 
         Returns:
             List of created VariantAttribute objects
         """
         attributes = [VariantAttribute(**data) for data in attributes_data]
         db.add_all(attributes)
-        db.flush()
+        if flush:
+            db.flush()
         return attributes
 
     @staticmethod
@@ -43,25 +46,22 @@ class VariantAttributeRepository:
         return value
 
     @staticmethod
-    def bulk_create_attribute_values(db: Session, values_data: List[dict]) -> List[VariantAttributeValue]:
+    def bulk_create_attribute_values(db: Session, values_data: List[dict], flush: bool = True) -> List[VariantAttributeValue]:
         """
         Create multiple attribute values in bulk
 
         Args:
             db: Database session
             values_data: List of dicts containing attribute value data
+            flush: Flush immediately (set False when ids are assigned by the caller)
 
         Returns:
             List of created VariantAttributeValue objects
         """
-        # Filter out temporary fields that start with _temp_
-        cleaned_data = [
-            {k: v for k, v in data.items() if not k.startswith('_temp_')}
-            for data in values_data
-        ]
-        values = [VariantAttributeValue(**data) for data in cleaned_data]
+        values = [VariantAttributeValue(**data) for data in values_data]
         db.add_all(values)
-        db.flush()
+        if flush:
+            db.flush()
         return values
 
     @staticmethod
@@ -85,7 +85,6 @@ class VariantAttributeRepository:
     @staticmethod
     def soft_delete(db: Session, attribute: VariantAttribute, deleted_by: str):
         """Soft delete a variant attribute"""
-        from datetime import datetime
         attribute.deleted_at = datetime.now()
         attribute.deleted_by = deleted_by
         db.flush()
@@ -94,7 +93,6 @@ class VariantAttributeRepository:
     @staticmethod
     def bulk_soft_delete(db: Session, attribute_ids: List[UUID], deleted_by: str):
         """Bulk soft delete variant attributes by IDs"""
-        from datetime import datetime
         db.query(VariantAttribute).filter(
             VariantAttribute.id.in_(attribute_ids)
         ).update({
@@ -103,36 +101,46 @@ class VariantAttributeRepository:
         }, synchronize_session=False)
         db.flush()
 
+    @staticmethod
+    def bulk_soft_delete_by_product(db: Session, product_id: UUID, deleted_by: str):
+        """Bulk soft delete all variant attributes of a product in one UPDATE"""
+        db.query(VariantAttribute).filter(
+            VariantAttribute.product_id == product_id,
+            VariantAttribute.deleted_at.is_(None)
+        ).update({
+            "deleted_at": datetime.now(),
+            "deleted_by": deleted_by
+        }, synchronize_session=False)
+        db.flush()
+
 
 class ProductVariantRepository:
 
     @staticmethod
-    def create_variant(db: Session, variant_data: dict) -> ProductVariant:
+    def create_variant(db: Session, variant_data: dict, flush: bool = True) -> ProductVariant:
         variant = ProductVariant(**variant_data)
         db.add(variant)
-        db.flush()
+        if flush:
+            db.flush()
         return variant
 
     @staticmethod
-    def bulk_create_variants(db: Session, variants_data: List[dict]) -> List[ProductVariant]:
+    def bulk_create_variants(db: Session, variants_data: List[dict], flush: bool = True) -> List[ProductVariant]:
         """
         Create multiple variants in bulk
 
         Args:
             db: Database session
             variants_data: List of dicts containing variant data
+            flush: Flush immediately (set False when ids are assigned by the caller)
 
         Returns:
             List of created ProductVariant objects
         """
-        # Filter out temporary fields that start with _temp_
-        cleaned_data = [
-            {k: v for k, v in data.items() if not k.startswith('_temp_')}
-            for data in variants_data
-        ]
-        variants = [ProductVariant(**data) for data in cleaned_data]
+        variants = [ProductVariant(**data) for data in variants_data]
         db.add_all(variants)
-        db.flush()
+        if flush:
+            db.flush()
         return variants
 
     @staticmethod
@@ -143,20 +151,22 @@ class ProductVariantRepository:
         return mapping
 
     @staticmethod
-    def bulk_create_attribute_mappings(db: Session, mappings_data: List[dict]) -> List[VariantAttributeMapping]:
+    def bulk_create_attribute_mappings(db: Session, mappings_data: Iterable[dict], flush: bool = True) -> List[VariantAttributeMapping]:
         """
         Create multiple attribute mappings in bulk
 
         Args:
             db: Database session
-            mappings_data: List of dicts containing mapping data
+            mappings_data: Iterable of dicts containing mapping data (a generator is fine)
+            flush: Flush immediately (set False when the caller flushes once at the end)
 
         Returns:
             List of created VariantAttributeMapping objects
         """
         mappings = [VariantAttributeMapping(**data) for data in mappings_data]
         db.add_all(mappings)
-        db.flush()
+        if flush:
+            db.flush()
         return mappings
 
     @staticmethod
@@ -199,7 +209,6 @@ class ProductVariantRepository:
 
     @staticmethod
     def soft_delete(db: Session, variant: ProductVariant, deleted_by: str):
-        from datetime import datetime
         variant.deleted_at = datetime.now()
         variant.deleted_by = deleted_by
         db.flush()
@@ -208,7 +217,6 @@ class ProductVariantRepository:
     @staticmethod
     def bulk_soft_delete(db: Session, variant_ids: List[UUID], deleted_by: str):
         """Bulk soft delete variants by IDs"""
-        from datetime import datetime
         db.query(ProductVariant).filter(
             ProductVariant.id.in_(variant_ids)
         ).update({
@@ -217,6 +225,18 @@ class ProductVariantRepository:
         }, synchronize_session=False)
         db.flush()
 
+    @staticmethod
+    def bulk_soft_delete_by_product(db: Session, product_id: UUID, deleted_by: str):
+        """Bulk soft delete all variants of a product in one UPDATE"""
+        db.query(ProductVariant).filter(
+            ProductVariant.product_id == product_id,
+            ProductVariant.deleted_at.is_(None)
+        ).update({
+            "deleted_at": datetime.now(),
+            "deleted_by": deleted_by
+        }, synchronize_session=False)
+        db.flush()
+
     @staticmethod
     def delete_attribute_mappings(db: Session, variant_id: UUID):
         """Delete all attribute mappings for a variant"""
@@ -1,6 +1,8 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 from typing import List
 from uuid import UUID
+import uuid as uuid_pkg
 from app.modules.product_variants.repository import ProductVariantRepository, VariantAttributeRepository
 from app.modules.product_variants.schema import (
     VariantAttributeCreate,
@@ -40,34 +42,50 @@ class VariantAttributeUsecase:
                     details={"product_type": product.product_type.value}
                 )
 
-            created_attributes = []
+            # 2. Prepare all attributes and values (ids assigned here, so values can reference them)
+            attributes_to_create = []
+            values_by_attribute = {}
 
             for attr_data in attributes:
-                # Create attribute
-                attribute = self.repository.create_attribute(self.db, {
+                attribute_id = uuid_pkg.uuid4()
+                attributes_to_create.append({
+                    "id": attribute_id,
                     "product_id": product_id,
                     "attribute_name": attr_data.attribute_name,
                     "display_order": attr_data.display_order,
                     "created_by": created_by
                 })
-
-                # Create attribute values
-                for value_data in attr_data.values:
-                    self.repository.create_attribute_value(self.db, {
-                        "attribute_id": attribute.id,
+                values_by_attribute[attribute_id] = [
+                    {
+                        "attribute_id": attribute_id,
                         "value": value_data.value,
                         "color_code": value_data.color_code,
                         "image_url": value_data.image_url,
                         "display_order": value_data.display_order
-                    })
+                    }
+                    for value_data in attr_data.values
+                ]
+
+            # 3. BULK INSERT: attributes and values, written by the single flush on commit
+            created_attributes = self.repository.bulk_create_attributes(self.db, attributes_to_create, flush=False)
+            created_values = {
+                attribute.id: self.repository.bulk_create_attribute_values(
+                    self.db, values_by_attribute[attribute.id], flush=False
+                )
+                for attribute in created_attributes
+            }
 
-                created_attributes.append(attribute)
+            # 4. Commit without expiring the objects just built
+            expire_on_commit = self.db.expire_on_commit
+            self.db.expire_on_commit = False
+            try:
+                self.db.commit()
+            finally:
+                self.db.expire_on_commit = expire_on_commit
 
-            self.db.commit()
-
-            # Refresh to get values
-            for attr in created_attributes:
-                self.db.refresh(attr)
+            # Attach values so the response includes them without a refresh per attribute
+            for attribute in created_attributes:
+                set_committed_value(attribute, "values", created_values[attribute.id])
 
             return SuccessResponse.created(
                 message="Variant attributes created successfully",
@@ -149,11 +167,12 @@ class ProductVariantUsecase:
 
             # 4. Generate variant code and name
             variant_sequence = self.repository.get_next_sequence(self.db, product_id)
-            variant_code = f"{product.product_code}-VAR-{str(variant_sequence).zfill(4)}"
+            variant_code = f"{product.product_code}-VAR-{variant_sequence:04d}"
             variant_name = " / ".join(variant_name_parts)  # e.g., "Large / Red"
 
             # 5. Create variant
             variant_data = {
+                "id": uuid_pkg.uuid4(),  # Client-side id: mappings can reference it without a flush
                 "product_id": product_id,
                 "variant_code": variant_code,
                 "variant_sequence": variant_sequence,
@@ -173,16 +192,18 @@ class ProductVariantUsecase:
                 "created_by": created_by
             }
 
-            variant = self.repository.create_variant(self.db, variant_data)
+            variant = self.repository.create_variant(self.db, variant_data, flush=False)
 
-            # 6. Create attribute mappings
-            for attr_mapping in data.attribute_values:
-                self.repository.create_attribute_mapping(self.db, {
+            # 6. BULK INSERT: Create all attribute mappings at once
+            self.repository.bulk_create_attribute_mappings(self.db, [
+                {
                     "variant_id": variant.id,
                     "attribute_value_id": attr_mapping.value_id
-                })
+                }
+                for attr_mapping in data.attribute_values
+            ], flush=False)
 
-            # 7. Commit
+            # 7. Commit (single flush of the variant and its mappings)
             self.db.commit()
             self.db.refresh(variant)
 
@@ -88,6 +88,8 @@ class ProductController:
         sort_order: str = "desc",
         page: Optional[int] = None,
         per_page: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
         db: Session = None  # type: ignore
     ):
         usecase = ProductUsecase(db)
@@ -97,7 +99,9 @@ class ProductController:
             sort_by=sort_by,
             sort_order=sort_order,
             page=page,
-            per_page=per_page
+            per_page=per_page,
+            cursor=cursor,
+            include_total=include_total
         )
 
     @staticmethod
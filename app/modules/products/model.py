@@ -88,4 +88,6 @@ class Product(Base):
         Index('idx_sequence_per_business', 'business_id', 'product_sequence', unique=True),
         Index('idx_sku_per_business', 'business_id', 'sku', unique=True),
         Index('idx_slug_per_business', 'business_id', 'slug', unique=True),
+        # List order / keyset pagination: ORDER BY created_at DESC, id DESC (index scanned backward)
+        Index('idx_products_created_at_id_not_deleted', 'created_at', 'id', postgresql_where=deleted_at.is_(None)),
     )
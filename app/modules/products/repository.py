@@ -1,5 +1,6 @@
-from sqlalchemy.orm import Session, joinedload
-from typing import Optional, List
+from sqlalchemy import select, func
+from sqlalchemy.orm import Session, selectinload
+from typing import Optional, List, Tuple
 from app.modules.products.model import Product
 from uuid import UUID
 
@@ -7,10 +8,11 @@ from uuid import UUID
 class ProductRepository:
 
     @staticmethod
-    def create_product(db: Session, product_data: dict) -> Product:
+    def create_product(db: Session, product_data: dict, flush: bool = True) -> Product:
         product = Product(**product_data)
         db.add(product)
-        db.flush()
+        if flush:
+            db.flush()
         return product
 
     @staticmethod
@@ -21,18 +23,29 @@ class ProductRepository:
         ).first()
 
     @staticmethod
-    def find_by_id_and_business(db: Session, product_id: UUID, business_id: UUID) -> Optional[Product]:
+    def find_by_id_and_business(
+        db: Session,
+        product_id: UUID,
+        business_id: UUID,
+        load_relations: bool = True
+    ) -> Optional[Product]:
+        """Find product by id within a business; load_relations=False skips the nested collections"""
         from app.modules.product_variants.model import ProductVariant, VariantAttribute
 
-        return db.query(Product).filter(
+        query = db.query(Product).filter(
             Product.id == product_id,
             Product.business_id == business_id,
             Product.deleted_at.is_(None)
-        ).options(
-            joinedload(Product.images),
-            joinedload(Product.variant_attributes).joinedload(VariantAttribute.values),
-            joinedload(Product.variants).joinedload(ProductVariant.images),
-            joinedload(Product.variants).joinedload(ProductVariant.attribute_mappings)
+        )
+        if not load_relations:
+            return query.first()
+
+        return query.options(
+            # selectinload: one extra SELECT per collection instead of a cartesian JOIN
+            selectinload(Product.images),
+            selectinload(Product.variant_attributes).selectinload(VariantAttribute.values),
+            selectinload(Product.variants).selectinload(ProductVariant.images),
+            selectinload(Product.variants).selectinload(ProductVariant.attribute_mappings)
         ).first()
 
     @staticmethod
@@ -64,6 +77,27 @@ class ProductRepository:
             Product.deleted_at.is_(None)
         ).count()
 
+    @staticmethod
+    def get_business_code_and_next_sequence(db: Session, business_id: UUID) -> Optional[Tuple[str, int]]:
+        """
+        Get (business_code, next product sequence) of an active business in one query.
+        Returns None if the business doesn't exist.
+        """
+        from app.modules.business.model import Business
+
+        next_sequence = select(
+            func.coalesce(func.max(Product.product_sequence), 0) + 1
+        ).where(
+            Product.business_id == Business.id
+        ).correlate(Business).scalar_subquery()
+
+        row = db.query(Business.business_code, next_sequence).filter(
+            Business.id == business_id,
+            Business.deleted_at.is_(None)
+        ).first()
+
+        return (row[0], row[1]) if row else None
+
     @staticmethod
     def get_next_sequence(db: Session, business_id: UUID) -> int:
         """Get next product sequence number for a business"""
@@ -74,11 +108,12 @@ class ProductRepository:
         return (max_sequence[0] + 1) if max_sequence else 1
 
     @staticmethod
-    def update_product(db: Session, product: Product, update_data: dict) -> Product:
+    def update_product(db: Session, product: Product, update_data: dict, flush: bool = True) -> Product:
         for key, value in update_data.items():
             if value is not None:
                 setattr(product, key, value)
-        db.flush()
+        if flush:
+            db.flush()
         return product
 
     @staticmethod
@@ -1,8 +1,7 @@
 from fastapi import APIRouter, Depends, Query, Form, File, UploadFile
 from sqlalchemy.orm import Session
 from uuid import UUID
-from typing import List, Optional
-import json
+from typing import List, Literal, Optional
 from app.config.deps import get_db, get_current_user, CurrentUser
 from app.modules.products.schema import ProductCreateSchema, ProductUpdateSchema
 from app.modules.products.controller import ProductController
@@ -95,9 +94,11 @@ async def create_product(
 def get_products(
     search: Optional[str] = Query(None, description="Search keyword (searches all fields)"),
     sort_by: Optional[str] = Query(None, description="Field name to sort by"),
-    sort_order: str = Query("desc", description="Sort order: asc or desc"),
+    sort_order: Literal["asc", "desc"] = Query("desc", description="Sort order: asc or desc"),
     page: Optional[int] = Query(None, ge=1, description="Page number (1-based)"),
     per_page: Optional[int] = Query(None, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from meta.next_cursor (keyset pagination; sort_by must be a non-null column)"),
+    include_total: bool = Query(True, description="Compute meta.total/total_pages (COUNT); false returns only has_next"),
     db: Session = Depends(get_db),
 ):
     """
@@ -115,6 +116,7 @@ def get_products(
 
     **Example:**
     - `/products?business_id={id}&search=kemeja&page=1&per_page=20&sort_by=name&sort_order=asc`
+    - `/products?per_page=20&cursor={meta.next_cursor}` (keyset pagination, no total count)
     """
     return ProductController.get_products_by_business(
         search=search,
@@ -122,6 +124,8 @@ def get_products(
         sort_order=sort_order,
         page=page,
         per_page=per_page,
+        cursor=cursor,
+        include_total=include_total,
         db=db
     )
 
@@ -1,34 +1,84 @@
-from sqlalchemy.orm import Session
-from typing import Dict, Any, List, Optional
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from typing import BinaryIO, Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple
 from uuid import UUID
 from slugify import slugify as create_slug  # type: ignore
 from fastapi import UploadFile
 import uuid as uuid_pkg
-import aiofiles  # type: ignore
+import asyncio
+import io
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import os
+import re
+import shutil
+import tempfile
+from operator import attrgetter
 from pathlib import Path
 from app.modules.products.repository import ProductRepository
 from app.modules.products.schema import ProductCreateSchema, ProductUpdateSchema, ProductImageCreate
 from app.modules.products.model import ProductType, Product
-from app.modules.business.repository import BusinessRepository
 from app.modules.product_variants.repository import VariantAttributeRepository, ProductVariantRepository
-from app.modules.product_variants.model import ProductVariant, VariantAttribute
+from app.modules.product_variants.model import ProductVariant, VariantAttribute, VariantAttributeValue
+from app.modules.media.model import ProductImage
 from app.modules.media.repository import ProductImageRepository
 from app.modules.naming_series import get_next_code
 from app.core.response import SuccessResponse
+from app.utils.query_builder import build_dynamic_query, paginate_query
 from app.core.exceptions import NotFoundException, BadRequestException
 
 
+# Upload directory, created once per process instead of on every usecase instantiation
+_UPLOAD_DIR = Path("images")
+_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+
+# Read/write size when saving uploads to disk (1 MB)
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Starlette keeps uploads up to this size in memory (MultiPartParser.max_file_size), larger ones spill to disk
+_UPLOAD_SPOOL_MAX_SIZE = 1024 * 1024
+
+# Variant image filenames: variant_{idx}_*, e.g. variant_1_image_0.jpg
+_VARIANT_FILENAME_RE = re.compile(r"^variant_(\d+)_")
+
+# Image columns copied 1:1 from ProductImageCreate into bulk insert rows
+_IMAGE_FIELDS = ("image_url", "image_path", "file_size", "mime_type", "display_order", "is_primary", "alt_text")
+_get_image_values = attrgetter(*_IMAGE_FIELDS)
+
+# Variant columns copied 1:1 from VariantCreate into bulk insert rows
+_VARIANT_FIELDS = (
+    "price_adjustment", "selling_price", "qty", "min_stock", "weight",
+    "length", "width", "height", "is_active", "is_default"
+)
+_get_variant_values = attrgetter(*_VARIANT_FIELDS)
+
+
+def _build_image_rows(
+    images: List[ProductImageCreate],
+    product_id: UUID,
+    variant_id: Optional[UUID],
+    created_by: str
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield bulk insert rows for images that share the same product/variant owner.
+    Rows are consumed one by one by the repository, so no row list is kept around.
+    """
+    owner = {"product_id": product_id, "variant_id": variant_id, "created_by": created_by}
+    for values in map(_get_image_values, images):
+        row = dict(zip(_IMAGE_FIELDS, values))
+        row.update(owner)
+        yield row
+
+
 class ProductUsecase:
 
     def __init__(self, db: Session):
         self.db = db
         self.repository = ProductRepository()
-        self.business_repository = BusinessRepository()
         self.attribute_repository = VariantAttributeRepository()
         self.variant_repository = ProductVariantRepository()
         self.image_repository = ProductImageRepository()
-        self.upload_dir = Path("images")
-        self.upload_dir.mkdir(parents=True, exist_ok=True)
+        self.upload_dir = _UPLOAD_DIR
 
     def _delete_physical_file(self, image_path: str) -> None:
         """Delete physical file from disk"""
@@ -40,21 +90,141 @@ class ProductUsecase:
             # Log error but don't raise - file might already be deleted
             print(f"Warning: Could not delete file {image_path}: {str(e)}")
 
-    async def _save_upload_file(self, file: UploadFile) -> Dict[str, Any]:
-        """Save uploaded file and return file info"""
+    def _delete_physical_files(self, image_paths: List[str]) -> None:
+        """Delete physical files concurrently (each delete is an independent blocking syscall)"""
+        if not image_paths:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(16, len(image_paths))) as executor:
+            # _delete_physical_file never raises, so one failure doesn't affect the others
+            list(executor.map(self._delete_physical_file, image_paths))
+
+    @staticmethod
+    def _raise_invalid_attribute_value(attribute_names: Set[str], attr_name: str, value_name: str) -> None:
+        """Raise the proper BadRequestException for an unknown attribute/value pair"""
+        if attr_name not in attribute_names:
+            raise BadRequestException(
+                message=f"Attribute '{attr_name}' not found in product attributes",
+                details={"attribute": attr_name}
+            )
+
+        raise BadRequestException(
+            message=f"Value '{value_name}' not found in attribute '{attr_name}'",
+            details={"attribute": attr_name, "value": value_name}
+        )
+
+    @classmethod
+    def _validate_variant_attribute_values(cls, data: ProductCreateSchema) -> None:
+        """
+        Check every variant's {attribute_name: value_name} against the declared attributes
+        in one pass, before anything is written or deleted.
+        """
+        attribute_names = {attr.attribute_name for attr in data.attributes}
+        valid_pairs = {
+            (attr.attribute_name, val.value)
+            for attr in data.attributes
+            for val in attr.values
+        }
+
+        for variant_data in data.variants:
+            for pair in variant_data.attribute_values.items():
+                if pair not in valid_pairs:
+                    cls._raise_invalid_attribute_value(attribute_names, *pair)
+
+    @classmethod
+    def _resolve_variant_attribute_values(
+        cls,
+        attribute_values: Dict[str, str],
+        flat_map: Dict[Tuple[str, str], UUID],
+        attribute_names: Set[str]
+    ) -> Tuple[str, List[UUID]]:
+        """Return (variant_name, attribute_value_ids) for a variant's {attribute_name: value_name}"""
+        # items() already yields (attribute_name, value_name), i.e. the flat_map keys
+        pairs = attribute_values.items()
+        attribute_value_ids = [flat_map.get(pair) for pair in pairs]
+        if None in attribute_value_ids:
+            attr_name, value_name = next(pair for pair in pairs if pair not in flat_map)
+            cls._raise_invalid_attribute_value(attribute_names, attr_name, value_name)
+
+        return " / ".join(attribute_values.values()), attribute_value_ids
+
+    @staticmethod
+    def _resolve_product_type(data: ProductCreateSchema) -> ProductType:
+        """
+        Convert the schema enum to the model enum once and validate nested data against it.
+        ProductTypeEnum (str enum) never compares equal to ProductType, so callers use the result.
+        """
+        product_type = ProductType(data.product_type.value)
+
+        if product_type is ProductType.VARIABLE:
+            if not data.attributes or not data.variants:
+                raise BadRequestException(
+                    message="VARIABLE product must have attributes and variants",
+                    details={"product_type": "VARIABLE"}
+                )
+        elif product_type is ProductType.SIMPLE:
+            if data.attributes or data.variants:
+                raise BadRequestException(
+                    message="SIMPLE product cannot have attributes or variants",
+                    details={"product_type": "SIMPLE"}
+                )
+
+        return product_type
+
+    def _create_staging_dir(self) -> Path:
+        """Create a per-request staging directory inside upload_dir (same filesystem for os.replace)"""
+        return Path(tempfile.mkdtemp(dir=self.upload_dir))
+
+    def _promote_staged_files(self, staging_dir: Path) -> None:
+        """Move staged files into upload_dir. Only call after the DB commit succeeded."""
+        for staged_file in staging_dir.iterdir():
+            os.replace(staged_file, self.upload_dir / staged_file.name)
+
+    @staticmethod
+    def _copy_upload(src: BinaryIO, file_path: Path, spilled: bool) -> int:
+        """
+        Copy an upload's spooled file to file_path, return the number of bytes written.
+        Uploads already spilled to disk are copied in-kernel with os.sendfile;
+        in-memory ones (and platforms without sendfile) use a chunked copy.
+        """
+        src.seek(0)
+        with open(file_path, 'wb') as out_file:
+            # Only for spilled uploads: fileno() of an in-memory SpooledTemporaryFile would first
+            # write it to a temp file (rollover), a second disk write
+            if spilled and hasattr(os, "sendfile"):
+                try:
+                    in_fd = src.fileno()
+                except (OSError, io.UnsupportedOperation):
+                    in_fd = None
+
+                if in_fd is not None:
+                    size = os.fstat(in_fd).st_size
+                    offset = 0
+                    while offset < size:
+                        sent = os.sendfile(out_file.fileno(), in_fd, offset, size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                    return offset
+
+            shutil.copyfileobj(src, out_file, _UPLOAD_CHUNK_SIZE)
+            return out_file.tell()
+
+    async def _save_upload_file(self, file: UploadFile, target_dir: Path) -> Dict[str, Any]:
+        """
+        Save uploaded file into target_dir and return file info.
+        URL and path always point to the final location in upload_dir.
+        """
         # Generate unique filename
         filename = file.filename or "unknown"
-        file_ext = Path(filename).suffix
-        unique_filename = f"{uuid_pkg.uuid4()}{file_ext}"
-        file_path = self.upload_dir / unique_filename
+        _, dot, ext = filename.rpartition(".")
+        file_ext = f".{ext}" if dot else ""
+        unique_filename = f"{uuid_pkg.uuid4().hex}{file_ext}"
+        file_path = target_dir / unique_filename
 
-        # Save file
-        async with aiofiles.open(file_path, 'wb') as out_file:
-            content = await file.read()
-            await out_file.write(content)
-
-        # Get file size
-        file_size = len(content)
+        # Save file in chunks with one worker-thread dispatch for open + all writes
+        spilled = file.size is not None and file.size > _UPLOAD_SPOOL_MAX_SIZE
+        file_size = await asyncio.to_thread(self._copy_upload, file.file, file_path, spilled)
 
         return {
             "image_url": f"/images/{unique_filename}",  # URL untuk access
@@ -64,6 +234,81 @@ class ProductUsecase:
             "filename": file.filename
         }
 
+    async def _stage_uploads(
+        self,
+        main_images: List[UploadFile],
+        variant_images: List[UploadFile],
+        staging_dir: Path,
+        product_name: str,
+        variant_count: int
+    ) -> Tuple[List[ProductImageCreate], List[List[ProductImageCreate]]]:
+        """
+        Save all uploads into staging_dir and build their ProductImageCreate entries.
+
+        Files are saved concurrently (at most 8 at a time); order is preserved because
+        asyncio.gather returns results in input order.
+
+        Variant files whose index has no matching variant are skipped (never saved).
+
+        Returns:
+            (main images, [variant images] indexed by variant position)
+        """
+        # Resolve variant index from filename pattern variant_{idx}_* first (no I/O)
+        variant_uploads: List[Tuple[int, UploadFile]] = []
+        for img_file in variant_images:
+            match = _VARIANT_FILENAME_RE.match(img_file.filename or "")
+            if not match:
+                # Skip files that don't match pattern
+                continue
+            variant_idx = int(match.group(1))
+            if variant_idx >= variant_count:
+                # Skip files for variants that don't exist
+                continue
+            variant_uploads.append((variant_idx, img_file))
+
+        semaphore = asyncio.Semaphore(8)
+
+        async def save(img_file: UploadFile) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._save_upload_file(img_file, staging_dir)
+
+        file_infos = await asyncio.gather(
+            *(save(img_file) for img_file in main_images),
+            *(save(img_file) for _, img_file in variant_uploads)
+        )
+        main_file_infos = file_infos[:len(main_images)]
+        variant_file_infos = file_infos[len(main_images):]
+
+        uploaded_main_images = [
+            ProductImageCreate(
+                image_url=file_info["image_url"],
+                image_path=file_info["image_path"],
+                file_size=file_info["file_size"],
+                mime_type=file_info["mime_type"],
+                display_order=idx,
+                is_primary=(idx == 0),  # First image is primary
+                alt_text=product_name
+            )
+            for idx, file_info in enumerate(main_file_infos)
+        ]
+
+        variant_images_by_index: List[List[ProductImageCreate]] = [[] for _ in range(variant_count)]
+        variant_alt_text = f"{product_name} variant"
+        for (variant_idx, _), file_info in zip(variant_uploads, variant_file_infos):
+            images = variant_images_by_index[variant_idx]
+            order = len(images)
+            images.append(ProductImageCreate(
+                image_url=file_info["image_url"],
+                image_path=file_info["image_path"],
+                file_size=file_info["file_size"],
+                mime_type=file_info["mime_type"],
+                display_order=order,
+                is_primary=(order == 0),  # First image of each variant is primary
+                alt_text=variant_alt_text
+            ))
+
+        return uploaded_main_images, variant_images_by_index
+
     async def create_product_with_files(
         self,
         data: ProductCreateSchema,
@@ -77,113 +322,128 @@ class ProductUsecase:
         """
         Create product with file uploads.
         This method handles file upload and then calls the regular create_product.
+        Files are written to a staging dir and only moved into upload_dir after commit.
         """
+        # Validate: At least 1 main image is required
+        if not main_images or len(main_images) == 0:
+            raise ValueError("At least 1 product image is required")
+
+        staging_dir = self._create_staging_dir()
         try:
-            # Validate: At least 1 main image is required
-            if not main_images or len(main_images) == 0:
-                raise ValueError("At least 1 product image is required")
+            # Slug is computed once per request and reused by create_product
+            slug = create_slug(data.name)
 
-            # 1. Upload main product images
-            uploaded_main_images = []
-            for idx, img_file in enumerate(main_images):
-                file_info = await self._save_upload_file(img_file)
-                uploaded_main_images.append(ProductImageCreate(
-                    image_url=file_info["image_url"],
-                    image_path=file_info["image_path"],
-                    file_size=file_info["file_size"],
-                    mime_type=file_info["mime_type"],
-                    display_order=idx,
-                    is_primary=(idx == 0),  # First image is primary
-                    alt_text=data.name
-                ))
-
-            # 2. Parse variant images by index (variant_0_image_0.jpg, variant_1_image_0.jpg, etc)
-            variant_images_map = {}  # {variant_index: [images]}
-            for img_file in variant_images:
-                # Extract variant index from filename pattern: variant_{idx}_*
-                try:
-                    filename = img_file.filename or ""
-                    if filename.startswith("variant_"):
-                        parts = filename.split("_")
-                        variant_idx = int(parts[1])  # Get index from variant_1_image_0.jpg
-
-                        file_info = await self._save_upload_file(img_file)
-
-                        if variant_idx not in variant_images_map:
-                            variant_images_map[variant_idx] = []
-
-                        variant_images_map[variant_idx].append(ProductImageCreate(
-                            image_url=file_info["image_url"],
-                            image_path=file_info["image_path"],
-                            file_size=file_info["file_size"],
-                            mime_type=file_info["mime_type"],
-                            display_order=len(variant_images_map[variant_idx]),
-                            is_primary=(len(variant_images_map[variant_idx]) == 0),
-                            alt_text=f"{data.name} variant"
-                        ))
-                except (ValueError, IndexError):
-                    # Skip files that don't match pattern
-                    continue
+            # 1-2. Upload main images and variant images (variant_0_image_0.jpg, variant_1_image_0.jpg, etc)
+            uploaded_main_images, variant_images_by_index = await self._stage_uploads(
+                main_images, variant_images, staging_dir, data.name, len(data.variants)
+            )
 
             # 3. Update data with uploaded images
             data.images = uploaded_main_images
 
             # Update variant images
-            for idx, variant in enumerate(data.variants):
-                if idx in variant_images_map:
-                    variant.images = variant_images_map[idx]
+            for variant, images in zip(data.variants, variant_images_by_index):
+                if images:
+                    variant.images = images
 
-            # 4. Call regular create_product method
-            return self.create_product(data, business_id, user_id, created_by)
+            # 4. Call regular create_product method in a worker thread so the event loop stays free
+            result = await asyncio.to_thread(self.create_product, data, business_id, user_id, created_by, slug)
 
-        except Exception as e:
-            # Cleanup uploaded files on error
-            # TODO: Implement cleanup
-            raise e
+            # 5. Commit succeeded: move staged files into place
+            self._promote_staged_files(staging_dir)
+
+            return result
 
-    def create_product(self, data: ProductCreateSchema, business_id: UUID, user_id: UUID, created_by: str):
+        finally:
+            # Drops the staging dir; on error this removes every file uploaded so far
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+    def _commit_with_created_rows(
+        self,
+        product: Product,
+        images: List[ProductImage],
+        attributes: List[VariantAttribute],
+        attribute_values: List[VariantAttributeValue],
+        variants: List[ProductVariant]
+    ) -> None:
+        """
+        Commit without expiring loaded state, then attach the rows created in this
+        transaction to product, so the response is built without refresh() or lazy loads.
+        """
+        expire_on_commit = self.db.expire_on_commit
+        self.db.expire_on_commit = False
+        try:
+            # The flush on commit sends one multi-row INSERT per table (product, images,
+            # attributes, values, variants, mappings) in FK order, all ids already assigned
+            self.db.commit()
+        finally:
+            self.db.expire_on_commit = expire_on_commit
+
+        values_by_attribute = defaultdict(list)
+        for value in attribute_values:
+            values_by_attribute[value.attribute_id].append(value)
+        for attribute in attributes:
+            set_committed_value(attribute, "values", values_by_attribute[attribute.id])
+
+        images_by_variant = defaultdict(list)
+        for image in images:
+            if image.variant_id is not None:
+                images_by_variant[image.variant_id].append(image)
+        for variant in variants:
+            set_committed_value(variant, "images", images_by_variant[variant.id])
+
+        set_committed_value(product, "images", images)
+        set_committed_value(product, "variant_attributes", attributes)
+        set_committed_value(product, "variants", variants)
+
+    def create_product(
+        self,
+        data: ProductCreateSchema,
+        business_id: UUID,
+        user_id: UUID,
+        created_by: str,
+        slug: Optional[str] = None
+    ):
         """
         Atomic product creation with nested attributes, variants, and images.
         All in 1 transaction with BULK INSERT operations for better performance!
+        Pass a precomputed slug to skip slugifying the name again.
+
+        Primary keys are generated client-side so nothing needs to be flushed
+        mid-way; every row is written by the single flush done on commit.
         """
         try:
-            # 1. Validate business exists
-            business = self.business_repository.find_by_id(self.db, str(business_id))
-            if not business:
+            # 1. Validate business exists and get its code + next product sequence (one query)
+            business_sequence = self.repository.get_business_code_and_next_sequence(self.db, business_id)
+            if not business_sequence:
                 raise NotFoundException(
                     message="Business not found",
                     details={"business_id": str(business_id)}
                 )
 
-            # 2. Validate product type consistency
-            if data.product_type == ProductType.VARIABLE:
-                if not data.attributes or not data.variants:
-                    raise BadRequestException(
-                        message="VARIABLE product must have attributes and variants",
-                        details={"product_type": "VARIABLE"}
-                    )
-            elif data.product_type == ProductType.SIMPLE:
-                if data.attributes or data.variants:
-                    raise BadRequestException(
-                        message="SIMPLE product cannot have attributes or variants",
-                        details={"product_type": "SIMPLE"}
-                    )
+            # 2. Validate product type consistency (and all variant attribute values, fail fast)
+            product_type = self._resolve_product_type(data)
+            is_variable = product_type is ProductType.VARIABLE
+            is_simple = product_type is ProductType.SIMPLE
+            if is_variable:
+                self._validate_variant_attribute_values(data)
 
             # 3. Generate product code
-            business_code = business.business_code
-            product_sequence = self.repository.get_next_sequence(self.db, business_id)
-            product_code = f"{business_code}-PROD-{str(product_sequence).zfill(4)}"
+            business_code, product_sequence = business_sequence
+            product_code = f"{business_code}-PROD-{product_sequence:04d}"
 
             # 4. Generate SKU for SIMPLE products (auto-generated from product_code)
             product_sku = None
-            if data.product_type == ProductType.SIMPLE:
+            if is_simple:
                 product_sku = f"SKU-{product_code}"
 
-            # 5. Generate slug
-            slug = create_slug(data.name)
+            # 5. Generate slug (unless already computed by the caller)
+            if slug is None:
+                slug = create_slug(data.name)
 
             # 6. Create product
             product_data = {
+                "id": uuid_pkg.uuid4(),
                 "product_code": product_code,
                 "product_sequence": product_sequence,
                 "user_id": user_id,
@@ -192,11 +452,11 @@ class ProductUsecase:
                 "slug": slug,
                 "description": data.description,
                 "category_id": data.category_id,
-                "product_type": data.product_type,
+                "product_type": product_type,
                 "base_price": data.base_price,
                 "selling_price": data.selling_price,
                 "track_inventory": data.track_inventory,
-                "qty": data.qty if data.product_type == ProductType.SIMPLE else None,
+                "qty": data.qty if is_simple else None,
                 "min_stock": data.min_stock,
                 "max_stock": data.max_stock,
                 "sku": product_sku,  # Auto-generated for SIMPLE, None for VARIABLE
@@ -209,160 +469,28 @@ class ProductUsecase:
                 "created_by": created_by
             }
 
-            product = self.repository.create_product(self.db, product_data)
+            product = self.repository.create_product(self.db, product_data, flush=False)
+
+            # Rows created below, attached to product after commit for the response
+            created_images = []
+            created_attributes = []
+            created_values = []
+            created_variants = []
 
             # 7. BULK INSERT: Prepare all product images
             if data.images:
-                product_images_data = [
-                    {
-                        "product_id": product.id,
-                        "variant_id": None,
-                        "image_url": img_data.image_url,
-                        "image_path": img_data.image_path,
-                        "file_size": img_data.file_size,
-                        "mime_type": img_data.mime_type,
-                        "display_order": img_data.display_order,
-                        "is_primary": img_data.is_primary,
-                        "alt_text": img_data.alt_text,
-                        "created_by": created_by
-                    }
-                    for img_data in data.images
-                ]
-                self.image_repository.bulk_create_images(self.db, product_images_data)
-
-            # 8. Create attributes and variants (for VARIABLE products only)
-            if data.product_type == ProductType.VARIABLE:
-                # BULK INSERT: Prepare all attributes
-                attributes_to_create = [
-                    {
-                        "product_id": product.id,
-                        "attribute_name": attr_data.attribute_name,
-                        "display_order": attr_data.display_order,
-                        "created_by": created_by
-                    }
-                    for attr_data in data.attributes
-                ]
-                created_attributes = self.attribute_repository.bulk_create_attributes(self.db, attributes_to_create)
-
-                # Build attribute map and prepare attribute values
-                attribute_map = {}  # {attribute_name: {value_name: value_id}}
-                all_attribute_values = []
-
-                for idx, attr_data in enumerate(data.attributes):
-                    attribute_id = created_attributes[idx].id
-                    attribute_map[attr_data.attribute_name] = {}
-
-                    for val_data in attr_data.values:
-                        all_attribute_values.append({
-                            "attribute_id": attribute_id,
-                            "value": val_data.value,
-                            "color_code": val_data.color_code,
-                            "image_url": val_data.image_url,
-                            "display_order": val_data.display_order,
-                            "_temp_attr_name": attr_data.attribute_name,  # Temporary for mapping
-                            "_temp_value_name": val_data.value
-                        })
-
-                # BULK INSERT: Create all attribute values at once
-                if all_attribute_values:
-                    created_values = self.attribute_repository.bulk_create_attribute_values(self.db, all_attribute_values)
-
-                    # Build the value map
-                    for value_obj, value_data in zip(created_values, all_attribute_values):
-                        attr_name = value_data["_temp_attr_name"]
-                        value_name = value_data["_temp_value_name"]
-                        attribute_map[attr_name][value_name] = value_obj.id
-
-                # Prepare variants data
-                variants_to_create = []
-                variant_mappings = []  # Store mappings to create after variants
-                variant_images_data = []  # Store images to create after variants
-
-                for idx, variant_data in enumerate(data.variants, start=1):
-                    # Build variant name from attribute values
-                    variant_name_parts = []
-                    attribute_value_ids = []
-
-                    for attr_name, value_name in variant_data.attribute_values.items():
-                        if attr_name not in attribute_map:
-                            raise BadRequestException(
-                                message=f"Attribute '{attr_name}' not found in product attributes",
-                                details={"attribute": attr_name}
-                            )
-
-                        if value_name not in attribute_map[attr_name]:
-                            raise BadRequestException(
-                                message=f"Value '{value_name}' not found in attribute '{attr_name}'",
-                                details={"attribute": attr_name, "value": value_name}
-                            )
-
-                        variant_name_parts.append(value_name)
-                        attribute_value_ids.append(attribute_map[attr_name][value_name])
-
-                    variant_name = " / ".join(variant_name_parts)
-                    variant_code = f"{product_code}-VAR-{str(idx).zfill(4)}"
-                    variant_sku = f"SKU-{variant_code}"
-
-                    variants_to_create.append({
-                        "product_id": product.id,
-                        "variant_code": variant_code,
-                        "variant_sequence": idx,
-                        "variant_name": variant_name,
-                        "price_adjustment": variant_data.price_adjustment,
-                        "selling_price": variant_data.selling_price,
-                        "sku": variant_sku,
-                        "qty": variant_data.qty,
-                        "min_stock": variant_data.min_stock,
-                        "weight": variant_data.weight,
-                        "length": variant_data.length,
-                        "width": variant_data.width,
-                        "height": variant_data.height,
-                        "is_active": variant_data.is_active,
-                        "is_default": variant_data.is_default,
-                        "created_by": created_by,
-                        "_temp_attribute_value_ids": attribute_value_ids,  # Temporary
-                        "_temp_images": variant_data.images  # Temporary
-                    })
-
-                # BULK INSERT: Create all variants
-                if variants_to_create:
-                    created_variants = self.variant_repository.bulk_create_variants(self.db, variants_to_create)
-
-                    # Prepare variant attribute mappings and images
-                    for variant_obj, variant_data in zip(created_variants, variants_to_create):
-                        # Prepare attribute mappings
-                        for value_id in variant_data["_temp_attribute_value_ids"]:
-                            variant_mappings.append({
-                                "variant_id": variant_obj.id,
-                                "attribute_value_id": value_id
-                            })
-
-                        # Prepare variant images
-                        for img_data in variant_data["_temp_images"]:
-                            variant_images_data.append({
-                                "product_id": product.id,
-                                "variant_id": variant_obj.id,
-                                "image_url": img_data.image_url,
-                                "image_path": img_data.image_path,
-                                "file_size": img_data.file_size,
-                                "mime_type": img_data.mime_type,
-                                "display_order": img_data.display_order,
-                                "is_primary": img_data.is_primary,
-                                "alt_text": img_data.alt_text,
-                                "created_by": created_by
-                            })
-
-                    # BULK INSERT: Create all variant attribute mappings
-                    if variant_mappings:
-                        self.variant_repository.bulk_create_attribute_mappings(self.db, variant_mappings)
-
-                    # BULK INSERT: Create all variant images
-                    if variant_images_data:
-                        self.image_repository.bulk_create_images(self.db, variant_images_data)
-
-            # 9. Commit transaction
-            self.db.commit()
-            self.db.refresh(product)
+                product_images_data = _build_image_rows(data.images, product.id, None, created_by)
+                created_images += self.image_repository.bulk_create_images(self.db, product_images_data, flush=False)
+
+            # 8. Create attributes, variants and variant images (for VARIABLE products only)
+            if is_variable:
+                created_attributes, created_values, created_variants, variant_images = self._add_variable_children(
+                    product, data, (variant_data.images for variant_data in data.variants), created_by
+                )
+                created_images += variant_images
+
+            # 9. Commit transaction (single flush of all pending rows, ordered by FK dependencies)
+            self._commit_with_created_rows(product, created_images, created_attributes, created_values, created_variants)
 
             return SuccessResponse.created(
                 message="Product created successfully",
@@ -373,6 +501,107 @@ class ProductUsecase:
             self.db.rollback()
             raise e
 
+    def _add_variable_children(
+        self,
+        product: Product,
+        data: ProductCreateSchema,
+        variant_images: Iterable[List[ProductImageCreate]],
+        created_by: str
+    ) -> Tuple[List[VariantAttribute], List[VariantAttributeValue], List[ProductVariant], List[ProductImage]]:
+        """
+        Add attributes, values, variants, mappings and variant images of a VARIABLE product
+        to the session (no flush). variant_images is parallel to data.variants.
+
+        Returns:
+            (attributes, attribute values, variants, variant images) for _commit_with_created_rows
+        """
+        # BULK INSERT: Prepare all attributes
+        attributes_to_create = [
+            {
+                "id": uuid_pkg.uuid4(),
+                "product_id": product.id,
+                "attribute_name": attr_data.attribute_name,
+                "display_order": attr_data.display_order,
+                "created_by": created_by
+            }
+            for attr_data in data.attributes
+        ]
+        created_attributes = self.attribute_repository.bulk_create_attributes(self.db, attributes_to_create, flush=False)
+
+        # Build attribute value lookup and prepare attribute values
+        attribute_names = set()
+        flat_map = {}  # {(attribute_name, value_name): value_id}, one hash per lookup
+        all_attribute_values = []
+
+        for idx, attr_data in enumerate(data.attributes):
+            attribute_id = created_attributes[idx].id
+            attribute_names.add(attr_data.attribute_name)
+
+            for val_data in attr_data.values:
+                value_id = uuid_pkg.uuid4()
+                flat_map[(attr_data.attribute_name, val_data.value)] = value_id
+                all_attribute_values.append({
+                    "id": value_id,
+                    "attribute_id": attribute_id,
+                    "value": val_data.value,
+                    "color_code": val_data.color_code,
+                    "image_url": val_data.image_url,
+                    "display_order": val_data.display_order
+                })
+
+        # BULK INSERT: Create all attribute values at once
+        created_values = self.attribute_repository.bulk_create_attribute_values(self.db, all_attribute_values, flush=False)
+
+        # Prepare variants data
+        variants_to_create = []  # Insert-ready rows (real columns only)
+        attribute_value_ids_per_variant = []  # Parallel to variants_to_create
+
+        variant_code_prefix = product.product_code + "-VAR-"
+        for idx, variant_data in enumerate(data.variants, start=1):
+            # Resolve value ids and build variant name from attribute values
+            variant_name, attribute_value_ids = self._resolve_variant_attribute_values(
+                variant_data.attribute_values, flat_map, attribute_names
+            )
+            variant_code = variant_code_prefix + f"{idx:04d}"
+            variant_sku = "SKU-" + variant_code
+
+            variant_row = dict(zip(_VARIANT_FIELDS, _get_variant_values(variant_data)))
+            variant_row.update(
+                id=uuid_pkg.uuid4(),
+                product_id=product.id,
+                variant_code=variant_code,
+                variant_sequence=idx,
+                variant_name=variant_name,
+                sku=variant_sku,
+                created_by=created_by
+            )
+            variants_to_create.append(variant_row)
+            attribute_value_ids_per_variant.append(attribute_value_ids)
+
+        # BULK INSERT: Create all variants
+        created_variants = self.variant_repository.bulk_create_variants(self.db, variants_to_create, flush=False)
+
+        # Variant attribute mappings and images are streamed from the in-memory payload
+        # (variant ids are already known), so the row dicts are never held as one big list
+        variant_mappings = (
+            {"variant_id": variant_row["id"], "attribute_value_id": value_id}
+            for variant_row, value_ids in zip(variants_to_create, attribute_value_ids_per_variant)
+            for value_id in value_ids
+        )
+        variant_images_data = (
+            image_row
+            for variant_row, images in zip(variants_to_create, variant_images)
+            for image_row in _build_image_rows(images, product.id, variant_row["id"], created_by)
+        )
+
+        # BULK INSERT: Create all variant attribute mappings
+        self.variant_repository.bulk_create_attribute_mappings(self.db, variant_mappings, flush=False)
+
+        # BULK INSERT: Create all variant images
+        created_variant_images = self.image_repository.bulk_create_images(self.db, variant_images_data, flush=False)
+
+        return created_attributes, created_values, created_variants, created_variant_images
+
     def get_product_by_id(self, product_id: UUID, business_id: UUID):
         product = self.repository.find_by_id_and_business(self.db, product_id, business_id)
         if not product:
@@ -393,16 +622,18 @@ class ProductUsecase:
         sort_by: Optional[str] = None,
         sort_order: str = "desc",
         page: Optional[int] = None,
-        per_page: Optional[int] = None
+        per_page: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True
     ):
         """
         Get products with all related data (images, variants, variant images, attributes)
         Uses dynamic query builder with pagination and filtering support.
-        """
-        from app.utils.query_builder import build_dynamic_query, calculate_pagination_meta
-        from sqlalchemy.orm import joinedload
 
-        # Build query with eager loading for all relationships
+        With a cursor, keyset pagination on (sort column, id) is used and the COUNT is skipped.
+        Offset pages sorted by a non-null column return next_cursor so clients can switch over.
+        """
+        # Build the filtered/sorted query once; it serves both the COUNT and the page
         query = build_dynamic_query(
             db=self.db,
             model=Product,
@@ -411,34 +642,23 @@ class ProductUsecase:
             sort_by=sort_by,
             sort_order=sort_order,
             default_sort_field="created_at",
-            auto_search_all_fields=True,
-            page=page,
-            per_page=per_page
+            auto_search_all_fields=True
         )
 
-        # Eager load all relationships to avoid N+1 queries
+        # Eager load all relationships to avoid N+1 queries.
+        # selectinload runs one SELECT ... WHERE id IN (<ids of this page>) per collection,
+        # instead of joining every collection into one row set (images x variants x mappings ...)
         query = query.options(
-            joinedload(Product.images),
-            joinedload(Product.variant_attributes).joinedload(VariantAttribute.values),
-            joinedload(Product.variants).joinedload(ProductVariant.images),
-            joinedload(Product.variants).joinedload(ProductVariant.attribute_mappings)
+            selectinload(Product.images),
+            selectinload(Product.variant_attributes).selectinload(VariantAttribute.values),
+            selectinload(Product.variants).selectinload(ProductVariant.images),
+            selectinload(Product.variants).selectinload(ProductVariant.attribute_mappings)
         )
 
-        # Calculate pagination if requested
-        if page is not None and per_page is not None:
-            count_query = build_dynamic_query(
-                db=self.db,
-                model=Product,
-                search=search,
-                filters=filters,
-                auto_search_all_fields=True
-            )
-            total = count_query.count()
-            pagination_meta = calculate_pagination_meta(total, page, per_page)
-        else:
-            pagination_meta = None
-
-        products = query.all()
+        products, pagination_meta = paginate_query(
+            query, Product, sort_by, sort_order,
+            page=page, per_page=per_page, cursor=cursor, include_total=include_total
+        )
 
         return SuccessResponse.retrieved(
             message="Products retrieved successfully",
@@ -459,331 +679,169 @@ class ProductUsecase:
         """
         Full replace update: Delete old nested data and create new ones.
         Handles images, variants, and attributes atomically.
+        New files are staged and only moved into upload_dir after commit.
         """
+        staging_dir = self._create_staging_dir()
         try:
             # Validate: At least 1 main image is required
             if not main_images or len(main_images) == 0:
                 raise ValueError("At least 1 product image is required")
 
-            # 1. Find existing product
-            product = self.repository.find_by_id_and_business(self.db, product_id, business_id)
+            # 1. Find existing product (old children are replaced by product_id, no need to load them)
+            product = self.repository.find_by_id_and_business(
+                self.db, product_id, business_id, load_relations=False
+            )
             if not product:
                 raise NotFoundException(
                     message="Product not found",
                     details={"product_id": str(product_id)}
                 )
 
-            # 2. Validate product type consistency
-            if data.product_type == ProductType.VARIABLE:
-                if not data.attributes or not data.variants:
-                    raise BadRequestException(
-                        message="VARIABLE product must have attributes and variants",
-                        details={"product_type": "VARIABLE"}
-                    )
-            elif data.product_type == ProductType.SIMPLE:
-                if data.attributes or data.variants:
-                    raise BadRequestException(
-                        message="SIMPLE product cannot have attributes or variants",
-                        details={"product_type": "SIMPLE"}
-                    )
-
-            # 3. Upload new images
-            uploaded_main_images = []
-            for idx, img_file in enumerate(main_images):
-                file_info = await self._save_upload_file(img_file)
-                uploaded_main_images.append(ProductImageCreate(
-                    image_url=file_info["image_url"],
-                    image_path=file_info["image_path"],
-                    file_size=file_info["file_size"],
-                    mime_type=file_info["mime_type"],
-                    display_order=idx,
-                    is_primary=(idx == 0),
-                    alt_text=data.name
-                ))
-
-            # 4. Parse variant images
-            variant_images_map = {}
-            for img_file in variant_images:
-                try:
-                    filename = img_file.filename or ""
-                    if filename.startswith("variant_"):
-                        parts = filename.split("_")
-                        variant_idx = int(parts[1])
-                        file_info = await self._save_upload_file(img_file)
-
-                        if variant_idx not in variant_images_map:
-                            variant_images_map[variant_idx] = []
-
-                        variant_images_map[variant_idx].append(ProductImageCreate(
-                            image_url=file_info["image_url"],
-                            image_path=file_info["image_path"],
-                            file_size=file_info["file_size"],
-                            mime_type=file_info["mime_type"],
-                            display_order=len(variant_images_map[variant_idx]),
-                            is_primary=(len(variant_images_map[variant_idx]) == 0),
-                            alt_text=f"{data.name} variant"
-                        ))
-                except (ValueError, IndexError):
-                    continue
-
-            # 5. Delete old images (files + DB)
-            old_images = self.image_repository.find_by_product_id(self.db, product_id)
-            for old_img in old_images:
-                self._delete_physical_file(old_img.image_path)
-                self.image_repository.soft_delete(self.db, old_img, updated_by)
-
-            # 6. Delete old variants (cascade will handle images and mappings)
-            if product.product_type == ProductType.VARIABLE:
-                # Get all variant images for deletion
-                for variant in product.variants:
-                    variant_images_to_delete = self.image_repository.find_by_variant_id(self.db, variant.id)
-                    for v_img in variant_images_to_delete:
-                        self._delete_physical_file(v_img.image_path)
-                    self.variant_repository.soft_delete(self.db, variant, updated_by)
-
-                # Delete old attributes (cascade will handle values)
-                for attribute in product.variant_attributes:
-                    self.attribute_repository.soft_delete(self.db, attribute, updated_by)
-
-            # 7. Update product basic data
-            product_update_data = {
-                "name": data.name,
-                "slug": create_slug(data.name),
-                "description": data.description,
-                "category_id": data.category_id,
-                "product_type": data.product_type,
-                "base_price": data.base_price,
-                "selling_price": data.selling_price,
-                "track_inventory": data.track_inventory,
-                "qty": data.qty if data.product_type == ProductType.SIMPLE else None,
-                "min_stock": data.min_stock,
-                "max_stock": data.max_stock,
-                "weight": data.weight,
-                "length": data.length,
-                "width": data.width,
-                "height": data.height,
-                "is_active": data.is_active,
-                "is_featured": data.is_featured,
-                "updated_by": updated_by
-            }
-            # SKU, product_code, product_sequence TIDAK boleh diubah
-
-            product = self.repository.update_product(self.db, product, product_update_data)
-
-            # 8. BULK INSERT: Create new product images
-            if uploaded_main_images:
-                product_images_data = [
-                    {
-                        "product_id": product.id,
-                        "variant_id": None,
-                        "image_url": img_data.image_url,
-                        "image_path": img_data.image_path,
-                        "file_size": img_data.file_size,
-                        "mime_type": img_data.mime_type,
-                        "display_order": img_data.display_order,
-                        "is_primary": img_data.is_primary,
-                        "alt_text": img_data.alt_text,
-                        "created_by": updated_by
-                    }
-                    for img_data in uploaded_main_images
-                ]
-                self.image_repository.bulk_create_images(self.db, product_images_data)
-
-            # 9. Create new attributes and variants (for VARIABLE products)
-            if data.product_type == ProductType.VARIABLE:
-                # BULK INSERT: Prepare all attributes
-                attributes_to_create = [
-                    {
-                        "product_id": product.id,
-                        "attribute_name": attr_data.attribute_name,
-                        "display_order": attr_data.display_order,
-                        "created_by": updated_by
-                    }
-                    for attr_data in data.attributes
-                ]
-                created_attributes = self.attribute_repository.bulk_create_attributes(self.db, attributes_to_create)
-
-                # Build attribute map and prepare attribute values
-                attribute_map = {}
-                all_attribute_values = []
-
-                for idx, attr_data in enumerate(data.attributes):
-                    attribute_id = created_attributes[idx].id
-                    attribute_map[attr_data.attribute_name] = {}
-
-                    for val_data in attr_data.values:
-                        all_attribute_values.append({
-                            "attribute_id": attribute_id,
-                            "value": val_data.value,
-                            "color_code": val_data.color_code,
-                            "image_url": val_data.image_url,
-                            "display_order": val_data.display_order,
-                            "_temp_attr_name": attr_data.attribute_name,
-                            "_temp_value_name": val_data.value
-                        })
-
-                # BULK INSERT: Create all attribute values at once
-                if all_attribute_values:
-                    created_values = self.attribute_repository.bulk_create_attribute_values(self.db, all_attribute_values)
-
-                    # Build the value map
-                    for value_obj, value_data in zip(created_values, all_attribute_values):
-                        attr_name = value_data["_temp_attr_name"]
-                        value_name = value_data["_temp_value_name"]
-                        attribute_map[attr_name][value_name] = value_obj.id
-
-                # Prepare variants data
-                variants_to_create = []
-                variant_mappings = []
-                variant_images_data = []
-
-                for idx, variant_data in enumerate(data.variants, start=1):
-                    variant_name_parts = []
-                    attribute_value_ids = []
-
-                    for attr_name, value_name in variant_data.attribute_values.items():
-                        if attr_name not in attribute_map:
-                            raise BadRequestException(
-                                message=f"Attribute '{attr_name}' not found in product attributes",
-                                details={"attribute": attr_name}
-                            )
-
-                        if value_name not in attribute_map[attr_name]:
-                            raise BadRequestException(
-                                message=f"Value '{value_name}' not found in attribute '{attr_name}'",
-                                details={"attribute": attr_name, "value": value_name}
-                            )
-
-                        variant_name_parts.append(value_name)
-                        attribute_value_ids.append(attribute_map[attr_name][value_name])
-
-                    variant_name = " / ".join(variant_name_parts)
-                    variant_code = f"{product.product_code}-VAR-{str(idx).zfill(4)}"
-                    variant_sku = f"SKU-{variant_code}"
-
-                    variants_to_create.append({
-                        "product_id": product.id,
-                        "variant_code": variant_code,
-                        "variant_sequence": idx,
-                        "variant_name": variant_name,
-                        "price_adjustment": variant_data.price_adjustment,
-                        "selling_price": variant_data.selling_price,
-                        "sku": variant_sku,
-                        "qty": variant_data.qty,
-                        "min_stock": variant_data.min_stock,
-                        "weight": variant_data.weight,
-                        "length": variant_data.length,
-                        "width": variant_data.width,
-                        "height": variant_data.height,
-                        "is_active": variant_data.is_active,
-                        "is_default": variant_data.is_default,
-                        "created_by": updated_by,
-                        "_temp_attribute_value_ids": attribute_value_ids,
-                        "_temp_variant_idx": idx - 1  # For image mapping
-                    })
-
-                # BULK INSERT: Create all variants
-                if variants_to_create:
-                    created_variants = self.variant_repository.bulk_create_variants(self.db, variants_to_create)
-
-                    # Prepare variant attribute mappings and images
-                    for variant_obj, variant_data in zip(created_variants, variants_to_create):
-                        # Prepare attribute mappings
-                        for value_id in variant_data["_temp_attribute_value_ids"]:
-                            variant_mappings.append({
-                                "variant_id": variant_obj.id,
-                                "attribute_value_id": value_id
-                            })
-
-                        # Prepare variant images
-                        variant_idx = variant_data["_temp_variant_idx"]
-                        if variant_idx in variant_images_map:
-                            for img_data in variant_images_map[variant_idx]:
-                                variant_images_data.append({
-                                    "product_id": product.id,
-                                    "variant_id": variant_obj.id,
-                                    "image_url": img_data.image_url,
-                                    "image_path": img_data.image_path,
-                                    "file_size": img_data.file_size,
-                                    "mime_type": img_data.mime_type,
-                                    "display_order": img_data.display_order,
-                                    "is_primary": img_data.is_primary,
-                                    "alt_text": img_data.alt_text,
-                                    "created_by": updated_by
-                                })
-
-                    # BULK INSERT: Create all variant attribute mappings
-                    if variant_mappings:
-                        self.variant_repository.bulk_create_attribute_mappings(self.db, variant_mappings)
-
-                    # BULK INSERT: Create all variant images
-                    if variant_images_data:
-                        self.image_repository.bulk_create_images(self.db, variant_images_data)
-
-            # 10. Commit transaction
-            self.db.commit()
-            self.db.refresh(product)
+            # 2. Validate product type consistency and all variant attribute values
+            # before any upload is saved or any old image file is deleted
+            product_type = self._resolve_product_type(data)
+            if product_type is ProductType.VARIABLE:
+                self._validate_variant_attribute_values(data)
 
-            return SuccessResponse.success(
-                message="Product updated successfully",
-                data=product
+            # 3-4. Upload new main images and variant images
+            uploaded_main_images, variant_images_by_index = await self._stage_uploads(
+                main_images, variant_images, staging_dir, data.name, len(data.variants)
+            )
+
+            # 5-11. Replace DB state in a worker thread so the event loop stays free
+            return await asyncio.to_thread(
+                self._replace_product,
+                product,
+                data,
+                product_type,
+                updated_by,
+                uploaded_main_images,
+                variant_images_by_index,
+                staging_dir
             )
 
         except Exception as e:
             self.db.rollback()
             raise e
 
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+    def _replace_product(
+        self,
+        product: Product,
+        data: ProductCreateSchema,
+        product_type: ProductType,
+        updated_by: str,
+        uploaded_main_images: List[ProductImageCreate],
+        variant_images_by_index: List[List[ProductImageCreate]],
+        staging_dir: Path
+    ):
+        """
+        Synchronous DB part of update_product_with_files (steps 5-11).
+        Caller is responsible for rollback and staging dir cleanup.
+
+        New rows get client-side primary keys, so they are all written by the
+        single flush done on commit.
+        """
+        product_id = product.id
+        is_variable = product_type is ProductType.VARIABLE
+        is_simple = product_type is ProductType.SIMPLE
+
+        # 5. Delete old images, main + variant images (files are removed after commit)
+        old_image_paths = self.image_repository.find_image_paths_by_product(self.db, product_id)
+
+        # BULK: Soft delete all old images at once (variant images carry product_id too)
+        self.image_repository.delete_by_product(self.db, product_id, updated_by)
+
+        # 6. BULK: Delete old variants and attributes (cascade will handle values and mappings)
+        if product.product_type is ProductType.VARIABLE:
+            self.variant_repository.bulk_soft_delete_by_product(self.db, product_id, updated_by)
+            self.attribute_repository.bulk_soft_delete_by_product(self.db, product_id, updated_by)
+
+        # 7. Update product basic data
+        product_update_data = {
+            "name": data.name,
+            "slug": create_slug(data.name),
+            "description": data.description,
+            "category_id": data.category_id,
+            "product_type": product_type,
+            "base_price": data.base_price,
+            "selling_price": data.selling_price,
+            "track_inventory": data.track_inventory,
+            "qty": data.qty if is_simple else None,
+            "min_stock": data.min_stock,
+            "max_stock": data.max_stock,
+            "weight": data.weight,
+            "length": data.length,
+            "width": data.width,
+            "height": data.height,
+            "is_active": data.is_active,
+            "is_featured": data.is_featured,
+            "updated_by": updated_by
+        }
+        # SKU, product_code, product_sequence TIDAK boleh diubah
+
+        product = self.repository.update_product(self.db, product, product_update_data, flush=False)
+
+        # Rows created below, attached to product after commit for the response
+        created_images = []
+        created_attributes = []
+        created_values = []
+        created_variants = []
+
+        # 8. BULK INSERT: Create new product images
+        if uploaded_main_images:
+            product_images_data = _build_image_rows(uploaded_main_images, product.id, None, updated_by)
+            created_images += self.image_repository.bulk_create_images(self.db, product_images_data, flush=False)
+
+        # 9. Create new attributes, variants and variant images (for VARIABLE products)
+        if is_variable:
+            created_attributes, created_values, created_variants, variant_images = self._add_variable_children(
+                product, data, variant_images_by_index, updated_by
+            )
+            created_images += variant_images
+
+        # 10. Commit transaction (single flush of all pending rows), then move staged files into place
+        self._commit_with_created_rows(product, created_images, created_attributes, created_values, created_variants)
+        self._promote_staged_files(staging_dir)
+
+        # 11. Old files are only removed once the replacement is committed (parallel pass)
+        self._delete_physical_files(old_image_paths)
+
+        return SuccessResponse.success(
+            message="Product updated successfully",
+            data=product
+        )
+
     def delete_product(self, product_id: UUID, business_id: UUID, deleted_by: str):
         """
         Delete product with BULK operations for better performance.
-        Physical files are deleted individually, but DB operations are batched.
+        Only image paths are fetched (no nested ORM graph); child rows are soft deleted
+        with one UPDATE per table. Files are deleted in parallel only after commit,
+        so the transaction isn't held open during file I/O.
         """
         try:
-            # 1. Find product with all relationships
-            product = self.repository.find_by_id_and_business(self.db, product_id, business_id)
+            # 1. Find product (nested collections aren't needed here)
+            product = self.repository.find_by_id_and_business(
+                self.db, product_id, business_id, load_relations=False
+            )
             if not product:
                 raise NotFoundException(
                     message="Product not found",
                     details={"product_id": str(product_id)}
                 )
 
-            # 2. Delete all physical image files and collect image IDs
-            # Delete main product images
-            main_image_ids = []
-            for image in product.images:
-                self._delete_physical_file(image.image_path)
-                main_image_ids.append(image.id)
-
-            # BULK: Soft delete all main product images at once
-            if main_image_ids:
-                self.image_repository.bulk_soft_delete(self.db, main_image_ids, deleted_by)
-
-            # 3. Delete variants and their images (for VARIABLE products)
-            if product.product_type == ProductType.VARIABLE:
-                variant_ids = []
-                variant_image_ids = []
+            # 2. Collect image paths (main + variant images) for file deletion after commit
+            image_paths = self.image_repository.find_image_paths_by_product(self.db, product.id)
 
-                # Collect all variant IDs and variant image IDs
-                for variant in product.variants:
-                    variant_ids.append(variant.id)
+            # BULK: Soft delete all images (variant images carry product_id too)
+            self.image_repository.delete_by_product(self.db, product.id, deleted_by)
 
-                    # Delete physical variant image files
-                    for v_image in variant.images:
-                        self._delete_physical_file(v_image.image_path)
-                        variant_image_ids.append(v_image.id)
-
-                # BULK: Soft delete all variant images at once
-                if variant_image_ids:
-                    self.image_repository.bulk_soft_delete(self.db, variant_image_ids, deleted_by)
-
-                # BULK: Soft delete all variants at once
-                if variant_ids:
-                    self.variant_repository.bulk_soft_delete(self.db, variant_ids, deleted_by)
-
-                # BULK: Soft delete all attributes at once
-                attribute_ids = [attr.id for attr in product.variant_attributes]
-                if attribute_ids:
-                    self.attribute_repository.bulk_soft_delete(self.db, attribute_ids, deleted_by)
+            # 3. Delete variants and attributes (for VARIABLE products)
+            if product.product_type is ProductType.VARIABLE:
+                self.variant_repository.bulk_soft_delete_by_product(self.db, product.id, deleted_by)
+                self.attribute_repository.bulk_soft_delete_by_product(self.db, product.id, deleted_by)
 
             # 4. Soft delete product
             self.repository.soft_delete(self.db, product, deleted_by)
@@ -791,11 +849,14 @@ class ProductUsecase:
             # 5. Commit
             self.db.commit()
 
-            return SuccessResponse.success(
-                message="Product deleted successfully",
-                data=None
-            )
-
         except Exception as e:
             self.db.rollback()
             raise e
+
+        # 6. Delete physical files in one parallel pass (a crash here only leaves orphaned files)
+        self._delete_physical_files(image_paths)
+
+        return SuccessResponse.success(
+            message="Product deleted successfully",
+            data=None
+        )
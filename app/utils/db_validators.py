@@ -3,12 +3,42 @@ Database Validators
 Auto-validate berdasarkan kolom database
 """
 
-from typing import Type, Any, Dict, Optional
+from functools import lru_cache
+from typing import Type, Any, Dict, NamedTuple, Optional, Tuple
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 from sqlalchemy.inspection import inspect
 from app.core.exceptions import ConflictException, ValidationException
 
 
+class ModelValidationSpec(NamedTuple):
+    """Kolom-kolom model yang relevan untuk validasi (urutan sesuai kolom di model)"""
+    unique_cols: Tuple[Tuple[str, Any], ...]   # (nama, InstrumentedAttribute)
+    conflict_messages: Dict[str, str]          # nama unique column -> pesan ConflictException
+    required_cols: Tuple[str, ...]             # nullable=False
+    length_map: Dict[str, int]                 # nama -> max length (hanya column yang punya length)
+    has_deleted_at: bool
+
+
+@lru_cache(maxsize=None)
+def _get_model_validation_spec(model: Type) -> ModelValidationSpec:
+    """Inspect model sekali saja; metadata kolom tidak berubah saat runtime"""
+    columns = inspect(model).columns
+    return ModelValidationSpec(
+        unique_cols=tuple((column.name, getattr(model, column.name)) for column in columns if column.unique),
+        conflict_messages={
+            column.name: f"{column.name.capitalize()} already exists" for column in columns if column.unique
+        },
+        required_cols=tuple(column.name for column in columns if not column.nullable),
+        length_map={
+            column.name: column.type.length
+            for column in columns
+            if getattr(column.type, "length", None)
+        },
+        has_deleted_at=hasattr(model, "deleted_at")
+    )
+
+
 def validate_unique_fields(
     model: Type,
     data: Dict[str, Any],
@@ -30,45 +60,42 @@ def validate_unique_fields(
     Example:
         validate_unique_fields(User, {"email": "test@test.com"}, db)
     """
-    # Get model inspector
-    mapper = inspect(model)
-
-    # Loop semua columns di model
-    for column in mapper.columns:
-        # Check jika column unique
-        if column.unique and column.name in data:
-            value = data[column.name]
-
-            # Skip jika value None atau empty
-            if not value:
-                continue
-
-            # Query untuk check apakah value sudah ada
-            query = db.query(model).filter(
-                getattr(model, column.name) == value
+    spec = _get_model_validation_spec(model)
+
+    # Kumpulkan unique columns yang ada di data (skip value None atau empty)
+    checks = {name: data[name] for name, _ in spec.unique_cols if data.get(name)}
+    if not checks:
+        return
+
+    # Satu query untuk semua unique fields: SELECT col1 = v1, col2 = v2 ... WHERE col1 = v1 OR col2 = v2.
+    # Perbandingan dilakukan DB (tipe kolom, collation), bukan di Python
+    conditions = {name: field == checks[name] for name, field in spec.unique_cols if name in checks}
+    query = db.query(
+        *(condition.label(name) for name, condition in conditions.items())
+    ).filter(or_(*conditions.values()))
+
+    # Exclude soft deleted records (jika model punya deleted_at)
+    if spec.has_deleted_at:
+        query = query.filter(model.deleted_at.is_(None))
+
+    # Exclude ID tertentu (untuk update)
+    if exclude_id:
+        query = query.filter(model.id != exclude_id)
+
+    existing_values = {name for row in query.all() for name, matched in zip(checks, row) if matched}
+
+    # Jika sudah ada, raise conflict (urutan sesuai kolom di model)
+    for name, value in checks.items():
+        if name in existing_values:
+            raise ConflictException(
+                message=spec.conflict_messages[name],
+                details={
+                    "field": name,
+                    "value": value,
+                    "constraint": "unique"
+                }
             )
 
-            # Exclude soft deleted records (jika model punya deleted_at)
-            if hasattr(model, 'deleted_at'):
-                query = query.filter(model.deleted_at.is_(None))
-
-            # Exclude ID tertentu (untuk update)
-            if exclude_id:
-                query = query.filter(model.id != exclude_id)
-
-            existing = query.first()
-
-            # Jika sudah ada, raise conflict
-            if existing:
-                raise ConflictException(
-                    message=f"{column.name.capitalize()} already exists",
-                    details={
-                        "field": column.name,
-                        "value": value,
-                        "constraint": "unique"
-                    }
-                )
-
 
 def validate_required_fields(
     model: Type,
@@ -90,18 +117,13 @@ def validate_required_fields(
         validate_required_fields(User, {"name": "John"}, exclude_fields=["id", "created_at"])
     """
     exclude_fields = exclude_fields or ["id", "created_at", "updated_at"]
-    mapper = inspect(model)
-
-    missing_fields = []
 
-    for column in mapper.columns:
-        # Skip excluded fields
-        if column.name in exclude_fields:
-            continue
-
-        # Check jika column required (not nullable) dan tidak ada di data
-        if not column.nullable and column.name not in data:
-            missing_fields.append(column.name)
+    # Required column (not nullable) yang tidak ada di data
+    missing_fields = [
+        name
+        for name in _get_model_validation_spec(model).required_cols
+        if name not in exclude_fields and name not in data
+    ]
 
     if missing_fields:
         raise ValidationException(
@@ -129,30 +151,27 @@ def validate_field_length(
     Example:
         validate_field_length(User, {"name": "Very long name..."})
     """
-    mapper = inspect(model)
     validation_errors = []
 
-    for column in mapper.columns:
-        if column.name not in data:
-            continue
+    length_map = _get_model_validation_spec(model).length_map
+    if not length_map:
+        return
 
-        value = data[column.name]
+    # Iterasi data (biasanya 1-3 field), lookup max length per field
+    for name, value in data.items():
+        max_length = length_map.get(name)
 
-        # Skip jika value bukan string
-        if not isinstance(value, str):
+        # Skip jika column tidak punya length atau value bukan string
+        if not max_length or not isinstance(value, str):
             continue
 
-        # Check max length jika column punya length
-        if hasattr(column.type, 'length') and column.type.length:
-            max_length = column.type.length
-
-            if len(value) > max_length:
-                validation_errors.append({
-                    "field": column.name,
-                    "value_length": len(value),
-                    "max_length": max_length,
-                    "message": f"{column.name} must be at most {max_length} characters"
-                })
+        if len(value) > max_length:
+            validation_errors.append({
+                "field": name,
+                "value_length": len(value),
+                "max_length": max_length,
+                "message": f"{name} must be at most {max_length} characters"
+            })
 
     if validation_errors:
         raise ValidationException(
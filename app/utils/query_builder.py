@@ -3,9 +3,45 @@ Dynamic Query Builder Utility
 Provides reusable filtering, searching, sorting, and pagination functionality with JOIN support
 """
 
-from typing import Type, List, Dict, Any
-from sqlalchemy.orm import Query, Session
-from sqlalchemy import or_, desc, asc
+import base64
+from functools import lru_cache
+from datetime import datetime
+from typing import Callable, Type, List, Dict, Any, Tuple
+from uuid import UUID
+import orjson
+from sqlalchemy.orm import Query, Session, contains_eager, raiseload, selectinload
+from sqlalchemy import String, func, literal_column, or_, desc, asc, tuple_
+from sqlalchemy.inspection import inspect as sqlalchemy_inspect
+from app.config.config import SQLALCHEMY_RAISELOAD
+from app.core.exceptions import BadRequestException
+
+
+# String columns never included by auto_search_all_fields (e.g. a joined users table)
+NON_SEARCHABLE_COLUMNS = frozenset({"password"})
+
+# Filter operator -> WHERE condition builder, built once at import instead of an if/elif chain per filter
+FILTER_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "equal": lambda field, value: field == value,
+    "not_equal": lambda field, value: field != value,
+    "like": lambda field, value: field.ilike(f"%{value}%"),
+    "contains": lambda field, value: field.ilike(f"%{value}%"),
+    "starts_with": lambda field, value: field.ilike(f"{value}%"),
+    "ends_with": lambda field, value: field.ilike(f"%{value}"),
+    "gt": lambda field, value: field > value,
+    "gte": lambda field, value: field >= value,
+    "lt": lambda field, value: field < value,
+    "lte": lambda field, value: field <= value,
+    "in": lambda field, value: field.in_(value) if isinstance(value, list) else None,
+    "not_in": lambda field, value: ~field.in_(value) if isinstance(value, list) else None,
+    "is_null": lambda field, value: field.is_(None),
+    "is_not_null": lambda field, value: field.isnot(None),
+}
+
+
+@lru_cache(maxsize=None)
+def _column_map(model: Type) -> Dict[str, Any]:
+    """{attribute name: column attribute} of a model, built once (replaces per-request hasattr/getattr)"""
+    return {column.key: getattr(model, column.key) for column in sqlalchemy_inspect(model).column_attrs}
 
 
 def calculate_pagination_meta(total: int, page: int, per_page: int) -> dict:
@@ -32,142 +68,6 @@ def calculate_pagination_meta(total: int, page: int, per_page: int) -> dict:
     }
 
 
-def apply_filters(
-    query: Query,
-    model: Type,
-    filters: List[Dict[str, Any]] | None = None
-) -> Query:
-    """
-    Apply dynamic filters to a SQLAlchemy query
-
-    Args:
-        query: SQLAlchemy query object
-        model: SQLAlchemy model class
-        filters: List of filter objects [{"key": "field_name", "operator": "equal", "value": "value"}]
-
-    Returns:
-        Modified query with filters applied
-
-    Supported operators:
-        - equal, not_equal
-        - like, contains, starts_with, ends_with
-        - gt, gte, lt, lte
-        - in, not_in
-        - is_null, is_not_null
-    """
-    if not filters:
-        return query
-
-    for filter_item in filters:
-        key = filter_item.get("key")
-        operator = filter_item.get("operator", "equal")
-        value = filter_item.get("value")
-
-        # Skip jika key tidak ada atau None
-        if not key or not hasattr(model, key):
-            continue
-
-        field = getattr(model, key)
-
-        # Apply operator
-        if operator == "equal":
-            query = query.filter(field == value)
-        elif operator == "not_equal":
-            query = query.filter(field != value)
-        elif operator == "like" or operator == "contains":
-            query = query.filter(field.ilike(f"%{value}%"))
-        elif operator == "starts_with":
-            query = query.filter(field.ilike(f"{value}%"))
-        elif operator == "ends_with":
-            query = query.filter(field.ilike(f"%{value}"))
-        elif operator == "gt":
-            query = query.filter(field > value)
-        elif operator == "gte":
-            query = query.filter(field >= value)
-        elif operator == "lt":
-            query = query.filter(field < value)
-        elif operator == "lte":
-            query = query.filter(field <= value)
-        elif operator == "in":
-            if isinstance(value, list):
-                query = query.filter(field.in_(value))
-        elif operator == "not_in":
-            if isinstance(value, list):
-                query = query.filter(~field.in_(value))
-        elif operator == "is_null":
-            query = query.filter(field.is_(None))
-        elif operator == "is_not_null":
-            query = query.filter(field.isnot(None))
-
-    return query
-
-
-def apply_search(
-    query: Query,
-    model: Type,
-    search: str | None = None,
-    search_fields: List[str] | None = None
-) -> Query:
-    """
-    Apply global search to specific fields
-
-    Args:
-        query: SQLAlchemy query object
-        model: SQLAlchemy model class
-        search: Search string
-        search_fields: List of field names to search in
-
-    Returns:
-        Modified query with search applied
-    """
-    if not search or not search_fields:
-        return query
-
-    search_conditions = []
-    for field_name in search_fields:
-        if hasattr(model, field_name):
-            field = getattr(model, field_name)
-            search_conditions.append(field.ilike(f"%{search}%"))
-
-    if search_conditions:
-        query = query.filter(or_(*search_conditions))
-
-    return query
-
-
-def apply_sorting(
-    query: Query,
-    model: Type,
-    sort_by: str | None = None,
-    sort_order: str = "desc",
-    default_sort_field: str = "created_at"
-) -> Query:
-    """
-    Apply dynamic sorting to query
-
-    Args:
-        query: SQLAlchemy query object
-        model: SQLAlchemy model class
-        sort_by: Field name to sort by
-        sort_order: "asc" or "desc" (default: desc)
-        default_sort_field: Default field to sort by if sort_by is not provided
-
-    Returns:
-        Modified query with sorting applied
-    """
-    # Use provided sort_by or fall back to default
-    field_name = sort_by if sort_by and hasattr(model, sort_by) else default_sort_field
-
-    if hasattr(model, field_name):
-        sort_field = getattr(model, field_name)
-        if sort_order.lower() == "asc":
-            query = query.order_by(asc(sort_field))
-        else:
-            query = query.order_by(desc(sort_field))
-
-    return query
-
-
 def build_dynamic_query(
     db: Session,
     model: Type,
@@ -207,8 +107,9 @@ def build_dynamic_query(
                 {
                     "model": CategoryMarketplace,
                     "condition": OrderSecret.category_marketplace_id == CategoryMarketplace.id,
-                    "relationship": "category_marketplace",  # Optional: for eager loading
+                    "relationship": "category_marketplace",  # Optional: eager load from this JOIN (contains_eager)
                     "load_only": ["id", "name", "description"],  # Optional: fields to load
+                    "loader": "auto",  # Optional: "auto" (selectin for one-to-many, else from JOIN), "joined", "selectin"
                     "is_outer": False  # Optional: True for LEFT JOIN, False for INNER JOIN (default)
                 }
             ]
@@ -216,6 +117,9 @@ def build_dynamic_query(
         page: Page number (1-based, optional)
         per_page: Items per page (optional, default: no pagination)
 
+    With SQLALCHEMY_RAISELOAD=1 the query gets raiseload("*"): relationships must be eager-loaded
+    via joins[...]["relationship"] or query.options(selectinload(...)), lazy loads raise.
+
     Returns:
         Configured SQLAlchemy query ready to execute (call .all() for all results, or use pagination)
 
@@ -270,14 +174,29 @@ def build_dynamic_query(
     # Start with base query
     query = db.query(model)
 
+    # SQLALCHEMY_RAISELOAD=1: any relationship not loaded by an explicit eager loader (joins, selectinload)
+    # raises instead of lazy loading, so N+1 regressions show up in dev/test
+    if SQLALCHEMY_RAISELOAD:
+        query = query.options(raiseload("*"))
+
+    # Column lookups come from the cached per-model map (no hasattr per request)
+    columns = _column_map(model)
+
+    # Base WHERE conditions and eager loaders are collected and applied with one filter()/options()
+    # call each: every Query.filter()/options() copies the whole Query object
+    base_conditions = []
+    loaders = []
+
     # Filter out soft-deleted records if model has deleted_at field
-    if not include_deleted and hasattr(model, 'deleted_at'):
-        query = query.filter(model.deleted_at.is_(None))
+    deleted_at = columns.get("deleted_at")
+    if not include_deleted and deleted_at is not None:
+        base_conditions.append(deleted_at.is_(None))
 
     # Filter by user_id if requested (for merchant to see only their own data)
     # Admin doesn't need this filter (filter_by_user=False)
-    if filter_by_user and current_user_id and hasattr(model, 'user_id'):
-        query = query.filter(model.user_id == current_user_id)
+    user_id = columns.get("user_id")
+    if filter_by_user and current_user_id and user_id is not None:
+        base_conditions.append(user_id == current_user_id)
 
     # Apply JOINs if provided
     joined_models = {}
@@ -303,62 +222,349 @@ def build_dynamic_query(
                 relationship_to_model[join_config["relationship"]] = join_model
 
             # Filter out soft-deleted from joined table if applicable
-            if not include_deleted and hasattr(join_model, 'deleted_at'):
-                query = query.filter(join_model.deleted_at.is_(None))
-
-            # Apply eager loading with load_only if relationship is specified
+            join_deleted_at = _column_map(join_model).get("deleted_at")
+            if not include_deleted and join_deleted_at is not None:
+                base_conditions.append(join_deleted_at.is_(None))
+
+            # Apply eager loading with load_only if relationship is specified.
+            # contains_eager fills the relationship from the JOIN above; joinedload would add
+            # a second (aliased) LEFT OUTER JOIN to the same table. One-to-many relationships
+            # use selectinload instead: one extra SELECT ... IN rather than a parent row per child
             if "relationship" in join_config:
                 relationship_name = join_config["relationship"]
+                relationship_attr = getattr(model, relationship_name)
+                loader_type = join_config.get("loader", "auto")
+                if loader_type == "auto":
+                    loader_type = "selectin" if relationship_attr.property.uselist else "joined"
+                if loader_type == "selectin":
+                    loader = selectinload(relationship_attr)
+                else:
+                    loader = contains_eager(relationship_attr)
                 if "load_only" in join_config:
-                    from sqlalchemy.orm import joinedload
                     load_only_fields = [getattr(join_model, field) for field in join_config["load_only"]]
-                    query = query.options(
-                        joinedload(getattr(model, relationship_name)).load_only(*load_only_fields)
-                    )
-                else:
-                    from sqlalchemy.orm import joinedload
-                    query = query.options(joinedload(getattr(model, relationship_name)))
+                    loader = loader.load_only(*load_only_fields)
+                loaders.append(loader)
 
-    # Auto-discover searchable fields if enabled
-    if auto_search_all_fields and search and not search_fields:
-        from sqlalchemy import String, Text
-        search_fields = []
+    if base_conditions:
+        query = query.filter(*base_conditions)
+    if loaders:
+        query = query.options(*loaders)
 
-        # Get string fields from main model
-        for column in model.__table__.columns:
-            if isinstance(column.type, (String, Text)):
-                search_fields.append(column.name)
+    # Models with __search_columns__ search their own columns through one concatenated document,
+    # served by a trigram GIN index on the same expression (see build_search_document)
+    search_document = None
+    if search and not search_fields and getattr(model, "__search_columns__", None):
+        search_document = build_search_document(model)
 
-        # Get string fields from joined models
-        for joined_model in relationship_to_model.values():
-            for column in joined_model.__table__.columns:
-                if isinstance(column.type, (String, Text)):
-                    search_fields.append(column.name)
+    # Auto-discover searchable fields if enabled
+    if auto_search_all_fields and search and not search_fields:
+        # String fields of the main model (unless the document covers them), then of the joined
+        # models as "relationship.col" so shared names (e.g. email) hit the joined column too
+        search_fields = [] if search_document is not None else list(_string_columns(model))
+        for relationship_name, joined_model in relationship_to_model.items():
+            search_fields.extend(f"{relationship_name}.{name}" for name in _string_columns(joined_model))
 
-    # Apply search (with JOIN support)
-    query = apply_search_with_joins(query, model, search, search_fields, joined_models, relationship_to_model)
+    # Apply search (with JOIN support), document predicate ORed with the joined columns
+    query = apply_search(
+        query, model, search, search_fields, joined_models, relationship_to_model, search_document
+    )
 
     # Apply filters (with JOIN support)
-    query = apply_filters_with_joins(query, model, filters, joined_models, relationship_to_model)
+    query = apply_filters(query, model, filters, joined_models, relationship_to_model)
 
     # Apply sorting (with JOIN support)
-    query = apply_sorting_with_joins(query, model, sort_by, sort_order, default_sort_field, joined_models, relationship_to_model)
+    query = apply_sorting(query, model, sort_by, sort_order, default_sort_field, joined_models, relationship_to_model)
 
     # Apply pagination if provided
-    if page is not None and per_page is not None:
-        offset = (page - 1) * per_page
-        query = query.limit(per_page).offset(offset)
+    return apply_pagination(query, page, per_page)
 
-    return query
 
+def build_search_document(model: Type) -> Any:
+    """
+    Build coalesce(col1, '') || ' ' || coalesce(col2, '') ... over model.__search_columns__
+
+    "document ILIKE '%q%'" matches every row "col1 ILIKE '%q%' OR col2 ILIKE ..." matches and, for
+    a term containing ' ', also rows where it spans two adjacent columns (e.g. "Toko Budi" over
+    business_name "Toko" + shop_name "Budi"). Unlike the OR of leading-wildcard ILIKEs, it can
+    use a pg_trgm GIN index on this exact expression.
+    """
+    separator = literal_column("' '", String)
+    document = None
+    for name in model.__search_columns__:
+        part = func.coalesce(getattr(model, name), literal_column("''", String))
+        document = part if document is None else document + separator + part
+    return document
 
-def apply_search_with_joins(
+
+def apply_pagination(query: Query, page: int | None = None, per_page: int | None = None) -> Query:
+    """
+    Apply limit/offset pagination
+
+    Args:
+        query: SQLAlchemy query object
+        page: Page number (1-based, optional)
+        per_page: Items per page (optional, default: no pagination)
+
+    Returns:
+        Modified query with pagination applied (unchanged if page or per_page is None)
+    """
+    if page is None or per_page is None:
+        return query
+
+    offset = (page - 1) * per_page
+    return query.limit(per_page).offset(offset)
+
+
+# Python types of sort columns whose values can be carried in a keyset cursor
+KEYSET_SORT_TYPES = (datetime, str, int, UUID)
+
+
+@lru_cache(maxsize=None)
+def _keyset_sort_type(model: Type, sort_field: str) -> type | None:
+    """Python type of `sort_field` if it can drive keyset pagination (NOT NULL main-model column), else None"""
+    field = _column_map(model).get(sort_field)
+    if field is None or "id" not in _column_map(model):
+        return None
+
+    column = field.property.columns[0]
+    if column.nullable:
+        # NULLs don't compare in (sort_field, id) < (...), rows would be skipped
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return None
+    return python_type if python_type in KEYSET_SORT_TYPES else None
+
+
+def supports_keyset_pagination(
+    model: Type,
+    sort_by: str | None = None,
+    default_sort_field: str = "created_at"
+) -> bool:
+    """Keyset (cursor) pagination works for any NOT NULL datetime/str/int/UUID column of the model, asc or desc"""
+    return _keyset_sort_type(model, sort_by or default_sort_field) is not None
+
+
+def encode_cursor(sort_field: str, sort_value: Any, id: Any) -> str:
+    """Encode the (sort value, id) key of the last row of a page into an opaque cursor"""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    elif isinstance(sort_value, UUID):
+        sort_value = str(sort_value)
+    payload = orjson.dumps({"sort": sort_field, "value": sort_value, "id": str(id)})
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def decode_cursor(cursor: str, sort_field: str, sort_type: type) -> Tuple[Any, UUID]:
+    """Decode a cursor from encode_cursor back into (sort value, id); it must belong to the same sort field"""
+    try:
+        payload = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if payload["sort"] != sort_field:
+            raise ValueError("cursor belongs to another sort field")
+
+        value = payload["value"]
+        if sort_type is datetime:
+            value = datetime.fromisoformat(value)
+        elif sort_type is UUID:
+            value = UUID(value)
+        elif not isinstance(value, sort_type) or isinstance(value, bool):
+            raise TypeError("cursor value has the wrong type")
+
+        return value, UUID(payload["id"])
+    except (ValueError, KeyError, TypeError):
+        raise BadRequestException(
+            message="Invalid cursor",
+            details={"cursor": cursor, "sort_by": sort_field}
+        )
+
+
+def apply_keyset_pagination(
+    query: Query,
+    model: Type,
+    cursor: str | None,
+    per_page: int,
+    sort_field: str = "created_at",
+    sort_order: str = "desc"
+) -> Query:
+    """
+    Apply keyset pagination on (sort_field, id):
+    WHERE (sort_field, id) < cursor ORDER BY sort_field DESC, id DESC (> and ASC for ascending order).
+    Deep pages cost the same as the first one (no OFFSET scan).
+
+    Fetches per_page + 1 rows; pass the result to calculate_cursor_meta to trim the extra row.
+    """
+    sort_column = _column_map(model)[sort_field]
+    ascending = sort_order.lower() == "asc"
+    direction = asc if ascending else desc
+    query = query.order_by(None).order_by(direction(sort_column), direction(model.id))
+
+    if cursor:
+        cursor_value, cursor_id = decode_cursor(cursor, sort_field, _keyset_sort_type(model, sort_field))
+        key = tuple_(sort_column, model.id)
+        query = query.filter(key > (cursor_value, cursor_id) if ascending else key < (cursor_value, cursor_id))
+
+    return query.limit(per_page + 1)
+
+
+def calculate_cursor_meta(items: List[Any], per_page: int, sort_field: str = "created_at") -> Tuple[List[Any], dict]:
+    """
+    Trim the extra row fetched by apply_keyset_pagination and build cursor metadata
+
+    Returns:
+        (items of this page, {"per_page", "has_next", "next_cursor"})
+    """
+    has_next = len(items) > per_page
+    items = items[:per_page]
+    next_cursor = encode_cursor(sort_field, getattr(items[-1], sort_field), items[-1].id) if has_next else None
+
+    return items, {
+        "per_page": per_page,
+        "has_next": has_next,
+        "next_cursor": next_cursor
+    }
+
+
+def paginate_query(
+    query: Query,
+    model: Type,
+    sort_by: str | None = None,
+    sort_order: str = "desc",
+    default_sort_field: str = "created_at",
+    page: int | None = None,
+    per_page: int | None = None,
+    cursor: str | None = None,
+    include_total: bool = True
+) -> Tuple[List[Any], dict | None]:
+    """
+    Execute a build_dynamic_query() query with offset or keyset pagination
+
+    Args:
+        query: Filtered/sorted query from build_dynamic_query (without page/per_page)
+        model: SQLAlchemy model class (needs id and a NOT NULL sort column for keyset pagination)
+        sort_by, sort_order, default_sort_field: Same values passed to build_dynamic_query
+        page: Page number (1-based, offset pagination)
+        per_page: Items per page
+        cursor: meta.next_cursor of the previous page (keyset pagination, skips COUNT and OFFSET)
+        include_total: Compute meta.total/total_pages, with COUNT(*) OVER () on the page query itself
+                       (one round trip). When False, has_next comes from
+                       fetching one extra row and the COUNT is skipped.
+
+    Returns:
+        (items, pagination meta or None when not paginated)
+
+    When sorting by a keyset-capable column (see supports_keyset_pagination), offset pages
+    also return next_cursor so clients can continue with keyset pagination after page 1.
+    """
+    sort_field = sort_by or default_sort_field
+    keyset = supports_keyset_pagination(model, sort_by, default_sort_field)
+
+    if cursor is not None:
+        if not keyset or per_page is None:
+            raise BadRequestException(
+                message="Cursor pagination requires per_page and sorting by a non-null column of this resource",
+                details={"sort_by": sort_by, "sort_order": sort_order, "per_page": per_page}
+            )
+        items = apply_keyset_pagination(query, model, cursor, per_page, sort_field, sort_order).all()
+        return calculate_cursor_meta(items, per_page, sort_field)
+
+    pagination_meta = None
+    if page is not None and per_page is not None and not include_total:
+        # No COUNT: fetch one extra row to know whether a next page exists
+        items = query.limit(per_page + 1).offset((page - 1) * per_page).all()
+        has_next = len(items) > per_page
+        items = items[:per_page]
+        pagination_meta = {
+            "page": page,
+            "per_page": per_page,
+            "has_next": has_next,
+            "has_prev": page > 1
+        }
+    elif page is not None and per_page is not None:
+        # Page and total in one round trip: COUNT(*) OVER () is computed before LIMIT/OFFSET
+        rows = apply_pagination(query.add_columns(func.count().over().label("total")), page, per_page).all()
+        items = [row[0] for row in rows]
+        if rows:
+            total = rows[0].total
+        elif page == 1:
+            total = 0
+        else:
+            # Past the last page no row carries the total; ORDER BY doesn't affect it
+            total = query.order_by(None).count()
+        pagination_meta = calculate_pagination_meta(total, page, per_page)
+    else:
+        items = query.all()
+
+    if pagination_meta is not None and keyset:
+        last = items[-1] if pagination_meta["has_next"] and items else None
+        pagination_meta["next_cursor"] = encode_cursor(sort_field, getattr(last, sort_field), last.id) if last else None
+
+    return items, pagination_meta
+
+
+@lru_cache(maxsize=None)
+def _string_columns(model: Type) -> Tuple[str, ...]:
+    """
+    Auto-search fields of a model (auto_search_all_fields), computed once:
+    its __search_columns__ if declared, else every String/Text column except NON_SEARCHABLE_COLUMNS
+    """
+    declared = getattr(model, "__search_columns__", None)
+    if declared:
+        return tuple(declared)
+    return tuple(
+        column.name
+        for column in model.__table__.columns
+        if isinstance(column.type, String) and column.name not in NON_SEARCHABLE_COLUMNS
+    )
+
+
+@lru_cache(maxsize=256)
+def _field_map(
+    model: Type,
+    joined_items: Tuple[Tuple[str, Type], ...],
+    relationship_items: Tuple[Tuple[str, Type], ...]
+) -> Dict[str, Any]:
+    """
+    Every field name a search/filter/sort key may use -> column attribute, per join layout:
+    "ClassName.col" and "relationship.col" for joined models, plain "col" for the main model
+    with the first joined (relationship) model as fallback
+    """
+    fields: Dict[str, Any] = {}
+
+    # Plain names: main model first, then joined models (first match wins)
+    for candidate in (model, *(joined_model for _, joined_model in relationship_items)):
+        for name, field in _column_map(candidate).items():
+            fields.setdefault(name, field)
+
+    # Dotted names: class name format wins over relationship name format
+    for prefix, joined_model in (*joined_items, *relationship_items):
+        for name, field in _column_map(joined_model).items():
+            fields.setdefault(f"{prefix}.{name}", field)
+
+    return fields
+
+
+def _resolve_fields(
+    model: Type,
+    joined_models: Dict[str, Type] | None,
+    relationship_to_model: Dict[str, Type] | None
+) -> Dict[str, Any]:
+    """Cached _field_map for this query's joins"""
+    return _field_map(
+        model,
+        tuple((joined_models or {}).items()),
+        tuple((relationship_to_model or {}).items())
+    )
+
+
+def apply_search(
     query: Query,
     model: Type,
     search: str | None = None,
     search_fields: List[str] | None = None,
     joined_models: Dict[str, Type] | None = None,
-    relationship_to_model: Dict[str, Type] | None = None
+    relationship_to_model: Dict[str, Type] | None = None,
+    search_document: Any = None
 ) -> Query:
     """
     Apply global search to specific fields (supports joined table fields)
@@ -371,48 +577,26 @@ def apply_search_with_joins(
                       Supports both "ModelName.field" and "relationship_name.field" formats
         joined_models: Dict of joined model class names to model classes
         relationship_to_model: Dict of relationship names to model classes
+        search_document: Optional build_search_document() expression, ORed with the field conditions
 
     Returns:
         Modified query with search applied
     """
-    if not search or not search_fields:
+    if not search or (not search_fields and search_document is None):
         return query
 
-    if joined_models is None:
-        joined_models = {}
-    if relationship_to_model is None:
-        relationship_to_model = {}
-
-    search_conditions = []
-    for field_name in search_fields:
-        # Check if it's a joined table field (e.g., "CategoryMarketplace.name" or "category_marketplace.name")
-        if "." in field_name:
-            prefix, column_name = field_name.split(".", 1)
-
-            # Try to find the model - check both class name and relationship name
-            joined_model = None
-            if prefix in joined_models:
-                # Class name format (e.g., "CategoryMarketplace.name")
-                joined_model = joined_models[prefix]
-            elif prefix in relationship_to_model:
-                # Relationship name format (e.g., "category_marketplace.name")
-                joined_model = relationship_to_model[prefix]
-
-            if joined_model and hasattr(joined_model, column_name):
-                field = getattr(joined_model, column_name)
-                search_conditions.append(field.ilike(f"%{search}%"))
-        else:
-            # Try main model first
-            if hasattr(model, field_name):
-                field = getattr(model, field_name)
-                search_conditions.append(field.ilike(f"%{search}%"))
-            else:
-                # Field not in main model - search in joined models
-                for joined_model in relationship_to_model.values():
-                    if hasattr(joined_model, field_name):
-                        field = getattr(joined_model, field_name)
-                        search_conditions.append(field.ilike(f"%{search}%"))
-                        break  # Only add once even if multiple joins have the same field
+    fields = _resolve_fields(model, joined_models, relationship_to_model)
+
+    pattern = f"%{search}%"
+    search_conditions = [search_document.ilike(pattern)] if search_document is not None else []
+    seen = set()
+    for field_name in search_fields or ():
+        # Plain "name", "ClassName.name" or "relationship_name.name" (unknown fields are skipped).
+        # Names shared by several models resolve to the same column: add its ILIKE only once
+        field = fields.get(field_name)
+        if field is not None and id(field) not in seen:
+            seen.add(id(field))
+            search_conditions.append(field.ilike(pattern))
 
     if search_conditions:
         query = query.filter(or_(*search_conditions))
@@ -420,7 +604,7 @@ def apply_search_with_joins(
     return query
 
 
-def apply_filters_with_joins(
+def apply_filters(
     query: Query,
     model: Type,
     filters: List[Dict[str, Any]] | None = None,
@@ -444,86 +628,30 @@ def apply_filters_with_joins(
     if not filters:
         return query
 
-    if joined_models is None:
-        joined_models = {}
-    if relationship_to_model is None:
-        relationship_to_model = {}
+    fields = _resolve_fields(model, joined_models, relationship_to_model)
 
+    conditions = []
     for filter_item in filters:
         key = filter_item.get("key")
         operator = filter_item.get("operator", "equal")
         value = filter_item.get("value")
 
-        # Skip if key is None
-        if not key:
+        # Plain "name", "ClassName.name" or "relationship_name.name"; skip if key is missing or unknown
+        field = fields.get(key) if isinstance(key, str) else None
+        if field is None:
             continue
 
-        # Check if it's a joined table field
-        if "." in key:
-            prefix, column_name = key.split(".", 1)
+        # Apply operator (unknown operators and in/not_in without a list are ignored)
+        build_condition = FILTER_OPERATORS.get(operator)
+        condition = build_condition(field, value) if build_condition else None
+        if condition is not None:
+            conditions.append(condition)
 
-            # Try to find the model - check both class name and relationship name
-            joined_model = None
-            if prefix in joined_models:
-                # Class name format (e.g., "CategoryMarketplace.name")
-                joined_model = joined_models[prefix]
-            elif prefix in relationship_to_model:
-                # Relationship name format (e.g., "category_marketplace.name")
-                joined_model = relationship_to_model[prefix]
+    # One filter() call: every Query.filter() copies the whole Query object
+    return query.filter(*conditions) if conditions else query
 
-            if not joined_model or not hasattr(joined_model, column_name):
-                continue
 
-            field = getattr(joined_model, column_name)
-        else:
-            # Try main model first
-            if hasattr(model, key):
-                field = getattr(model, key)
-            else:
-                # Field not in main model - search in joined models
-                field = None
-                for joined_model in relationship_to_model.values():
-                    if hasattr(joined_model, key):
-                        field = getattr(joined_model, key)
-                        break  # Use first match
-
-                if field is None:
-                    continue  # Field not found in any model
-
-        # Apply operator
-        if operator == "equal":
-            query = query.filter(field == value)
-        elif operator == "not_equal":
-            query = query.filter(field != value)
-        elif operator == "like" or operator == "contains":
-            query = query.filter(field.ilike(f"%{value}%"))
-        elif operator == "starts_with":
-            query = query.filter(field.ilike(f"{value}%"))
-        elif operator == "ends_with":
-            query = query.filter(field.ilike(f"%{value}"))
-        elif operator == "gt":
-            query = query.filter(field > value)
-        elif operator == "gte":
-            query = query.filter(field >= value)
-        elif operator == "lt":
-            query = query.filter(field < value)
-        elif operator == "lte":
-            query = query.filter(field <= value)
-        elif operator == "in":
-            if isinstance(value, list):
-                query = query.filter(field.in_(value))
-        elif operator == "not_in":
-            if isinstance(value, list):
-                query = query.filter(~field.in_(value))
-        elif operator == "is_null":
-            query = query.filter(field.is_(None))
-        elif operator == "is_not_null":
-            query = query.filter(field.isnot(None))
-
-    return query
-
-
-def apply_sorting_with_joins(
+def apply_sorting(
     query: Query,
     model: Type,
     sort_by: str | None = None,
@@ -541,53 +669,28 @@ def apply_sorting_with_joins(
         sort_by: Field name to sort by
                 Supports both "ModelName.field" and "relationship_name.field" formats
         sort_order: "asc" or "desc" (default: desc)
-        default_sort_field: Default field to sort by if sort_by is not provided
+        default_sort_field: Default field to sort by if sort_by is not provided or unknown
         joined_models: Dict of joined model class names to model classes
         relationship_to_model: Dict of relationship names to model classes
 
     Returns:
         Modified query with sorting applied
     """
-    if joined_models is None:
-        joined_models = {}
-    if relationship_to_model is None:
-        relationship_to_model = {}
-
-    # Determine the field to sort by
-    field_name = sort_by if sort_by else default_sort_field
-    sort_field = None
-
-    # Check if it's a joined table field
-    if "." in field_name:
-        prefix, column_name = field_name.split(".", 1)
-
-        # Try to find the model - check both class name and relationship name
-        joined_model = None
-        if prefix in joined_models:
-            # Class name format (e.g., "CategoryMarketplace.name")
-            joined_model = joined_models[prefix]
-        elif prefix in relationship_to_model:
-            # Relationship name format (e.g., "category_marketplace.name")
-            joined_model = relationship_to_model[prefix]
-
-        if joined_model and hasattr(joined_model, column_name):
-            sort_field = getattr(joined_model, column_name)
-    else:
-        # Try main model first
-        if hasattr(model, field_name):
-            sort_field = getattr(model, field_name)
-        else:
-            # Field not in main model - search in joined models
-            for joined_model in relationship_to_model.values():
-                if hasattr(joined_model, field_name):
-                    sort_field = getattr(joined_model, field_name)
-                    break  # Use first match
-
-    # Apply sorting if field was found
+    # Determine the field to sort by (plain, "ClassName.name" or "relationship_name.name"),
+    # unknown sort_by falls back to default_sort_field
+    fields = _resolve_fields(model, joined_models, relationship_to_model)
+    sort_field = fields.get(sort_by) if sort_by else None
+    if sort_field is None:
+        sort_field = fields.get(default_sort_field)
+
+    # Apply sorting if field was found. The primary key breaks ties in the same direction so
+    # the order is total: stable OFFSET pages, exact keyset cursors, served by (sort_field, id) indexes
     if sort_field is not None:
-        if sort_order.lower() == "asc":
-            query = query.order_by(asc(sort_field))
-        else:
-            query = query.order_by(desc(sort_field))
+        direction = asc if sort_order.lower() == "asc" else desc
+        order = [direction(sort_field)]
+        pk = _column_map(model).get("id")
+        if pk is not None and sort_field is not pk:
+            order.append(direction(pk))
+        query = query.order_by(*order)
 
     return query